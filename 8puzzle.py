@@ -1,134 +1,995 @@
 import heapq
+import math
+import mmap
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+from itertools import count, islice
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Blank moves: Up, Down, Left, Right
+OPPOSITE = (1, 0, 3, 2)  # Direction code that undoes each move
+
+
+class BoardCodec:
+    """
+    Packs boards of one shape into a single integer.
+    The tile at row-major index i occupies bits [i * bits, (i + 1) * bits), so
+    the 8- and 15-puzzle use 4 bits per tile. Hashing, equality and slides are
+    then plain integer operations.
+    """
+    __slots__ = ("rows", "cols", "size", "bits", "mask", "coords", "moves", "neighbors", "offsets")
+
+    def __init__(self, rows, cols):
+        """
+        Initialize a codec for boards of the given shape.
+        :param rows: Number of rows on the board.
+        :param cols: Number of columns on the board.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.size = rows * cols
+        self.bits = max(1, (self.size - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.coords = tuple(divmod(index, cols) for index in range(self.size))
+
+        # (index the blank swaps with, direction code) for every legal blank move
+        self.moves = tuple(
+            tuple(((x + dx) * cols + (y + dy), direction) for direction, (dx, dy) in enumerate(DIRECTIONS)
+                  if 0 <= x + dx < rows and 0 <= y + dy < cols)
+            for x, y in self.coords
+        )
+        self.neighbors = tuple(tuple(index for index, _ in moves) for moves in self.moves)
+        self.offsets = tuple(dx * cols + dy for dx, dy in DIRECTIONS)  # Blank index change per direction
+
+    def pack(self, board):
+        """
+        Pack a board into an integer.
+        :param board: 2D tuple representing the puzzle board.
+        :return: Packed board code.
+        """
+        code = 0
+        for value in reversed([value for row in board for value in row]):
+            code = (code << self.bits) | value
+        return code
+
+    def unpack(self, code):
+        """
+        Unpack an integer back into a board.
+        :param code: Packed board code.
+        :return: 2D tuple representing the puzzle board.
+        """
+        values = [(code >> (index * self.bits)) & self.mask for index in range(self.size)]
+        return tuple(tuple(values[x * self.cols:(x + 1) * self.cols]) for x in range(self.rows))
+
+    def tile_at(self, code, index):
+        """Return the tile stored at a row-major board index."""
+        return (code >> (index * self.bits)) & self.mask
+
+    def slide(self, code, blank, index, tile):
+        """
+        Slide the tile at `index` into the blank.
+        The blank's bits are always zero, so two XORs move the tile.
+        :return: Packed code of the resulting board.
+        """
+        return code ^ (tile << (index * self.bits)) ^ (tile << (blank * self.bits))
+
+
+@lru_cache(maxsize=None)
+def board_codec(rows, cols):
+    """Return the shared BoardCodec for boards of the given shape."""
+    return BoardCodec(rows, cols)
+
 
 class PuzzleState:
-    def __init__(self, board, moves=0, previous=None):
+    __slots__ = ("codec", "code", "blank", "moves", "direction", "heuristic")
+
+    def __init__(self, board, moves=0, direction=None, heuristic=None):
         """
         Initialize a puzzle state.
+        States don't link to their parents; solvers record `direction` in a
+        move table and replay it with reconstruct_path.
         :param board: 2D tuple representing the puzzle board.
         :param moves: Number of moves taken to reach this state.
-        :param previous: Reference to the previous PuzzleState.
+        :param direction: Direction code (index into DIRECTIONS) of the blank move that produced this state.
+        :param heuristic: Manhattan distance of the board, if already known.
         """
-        self.board = board
+        self.codec = board_codec(len(board), len(board[0]))
+        self.code = self.codec.pack(board)
         self.moves = moves
-        self.previous = previous
-        self.blank_pos = self.find_blank()  # Locate the blank tile (0)
+        self.direction = direction
+        self.heuristic = heuristic
+        self.blank = None
+        x, y = self.find_blank()  # Locate the blank tile (0)
+        self.blank = x * self.codec.cols + y
+
+    @classmethod
+    def from_code(cls, codec, code, blank, moves=0, direction=None, heuristic=None):
+        """
+        Build a state directly from a packed board, skipping the blank search.
+        :param codec: BoardCodec matching the board shape.
+        :param code: Packed board code.
+        :param blank: Row-major index of the blank tile.
+        :return: New PuzzleState.
+        """
+        state = cls.__new__(cls)
+        state.codec = codec
+        state.code = code
+        state.blank = blank
+        state.moves = moves
+        state.direction = direction
+        state.heuristic = heuristic
+        return state
+
+    @property
+    def board(self):
+        """2D tuple representing the puzzle board."""
+        return self.codec.unpack(self.code)
+
+    @property
+    def blank_pos(self):
+        """(row, column) of the blank tile."""
+        return self.codec.coords[self.blank]
 
     def find_blank(self):
         """Find the position of the blank tile (0)."""
-        for i, row in enumerate(self.board):
-            for j, value in enumerate(row):
-                if value == 0:
-                    return (i, j)
+        if self.blank is not None:
+            return self.codec.coords[self.blank]
+        for index in range(self.codec.size):
+            if self.codec.tile_at(self.code, index) == 0:
+                return self.codec.coords[index]
 
-    def manhattan_distance(self, goal):
+    def manhattan_distance(self, goal, positions=None):
         """
         Calculate the Manhattan distance heuristic.
         :param goal: Goal state as a 2D tuple.
+        :param positions: Optional goal-position table from goal_positions(goal).
         :return: Total Manhattan distance of the board from the goal state.
         """
+        if positions is None:
+            positions = goal_positions(goal)
         distance = 0
-        for i, row in enumerate(self.board):
-            for j, value in enumerate(row):
-                if value != 0:  # Skip the blank tile
-                    goal_x, goal_y = [(x, y) for x, row in enumerate(goal) for y, v in enumerate(row) if v == value][0]
-                    distance += abs(i - goal_x) + abs(j - goal_y)
+        for index, (i, j) in enumerate(self.codec.coords):
+            value = self.codec.tile_at(self.code, index)
+            if value != 0:  # Skip the blank tile
+                goal_x, goal_y = positions[value]
+                distance += abs(i - goal_x) + abs(j - goal_y)
         return distance
 
-    def possible_moves(self):
+    def possible_moves(self, positions=None):
         """
         Generate possible moves by sliding tiles.
+        When a goal-position table is given and this state's heuristic is known,
+        each child's Manhattan distance is derived from this one: only the tile
+        that slides into the blank changes its distance, by exactly one.
+        :param positions: Optional goal-position table from goal_positions(goal).
         :return: List of new PuzzleState instances after making moves.
         """
         moves = []
-        x, y = self.blank_pos
-        directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
-
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if 0 <= nx < len(self.board) and 0 <= ny < len(self.board[0]):  # Check bounds
-                new_board = [list(row) for row in self.board]
-                new_board[x][y], new_board[nx][ny] = new_board[nx][ny], new_board[x][y]
-                moves.append(PuzzleState(tuple(tuple(row) for row in new_board), self.moves + 1, self))
+        codec = self.codec
+        x, y = codec.coords[self.blank]
+        incremental = positions is not None and self.heuristic is not None
+
+        for index, direction in codec.moves[self.blank]:
+            tile = codec.tile_at(self.code, index)
+            heuristic = None
+            if incremental:
+                nx, ny = codec.coords[index]
+                goal_x, goal_y = positions[tile]
+                heuristic = (self.heuristic
+                             + abs(x - goal_x) + abs(y - goal_y)
+                             - abs(nx - goal_x) - abs(ny - goal_y))
+            code = codec.slide(self.code, self.blank, index, tile)
+            moves.append(PuzzleState.from_code(codec, code, index, self.moves + 1, direction, heuristic))
         return moves
 
     def __eq__(self, other):
-        return self.board == other.board
+        return self.code == other.code
 
     def __hash__(self):
-        return hash(self.board)
+        return hash(self.code)
 
     def __lt__(self, other):
-        return self.board < other.board  # For priority queue ordering
+        return self.code < other.code  # For priority queue ordering
 
 
-def a_star(initial, goal):
+class BucketQueue:
     """
-    Solve the 8-puzzle problem using the A* algorithm.
+    Priority queue for small non-negative integer priorities.
+    Entries are kept in buckets indexed by f and then by g, so push and pop
+    are O(1) amortized. Among entries with the lowest f, pop prefers the
+    highest g, i.e. the node closest to a solution.
+    """
+
+    def __init__(self):
+        self.buckets = []  # buckets[f][g] is a list of entries
+        self.min_f = 0
+        self.size = 0
+
+    def push(self, f, g, item):
+        """Add an entry with priority f and path cost g."""
+        while len(self.buckets) <= f:
+            self.buckets.append([])
+        bucket = self.buckets[f]
+        while len(bucket) <= g:
+            bucket.append([])
+        bucket[g].append(item)
+        self.size += 1
+        if f < self.min_f:
+            self.min_f = f
+
+    def pop(self):
+        """
+        Remove the entry with the lowest f, breaking ties toward higher g.
+        :return: Tuple (f, g, item).
+        """
+        if not self.size:
+            raise IndexError("pop from an empty BucketQueue")
+        while not self.buckets[self.min_f]:
+            self.min_f += 1
+        bucket = self.buckets[self.min_f]
+        g = len(bucket) - 1
+        item = bucket[g].pop()
+        while bucket and not bucket[-1]:  # Keep the highest g at the end
+            bucket.pop()
+        self.size -= 1
+        return self.min_f, g, item
+
+    def __len__(self):
+        return self.size
+
+
+def goal_positions(goal):
+    """
+    Build the goal-position table used by the Manhattan heuristic.
+    :param goal: Goal state as a 2D tuple.
+    :return: Dictionary mapping each tile to its (row, column) in the goal state.
+    """
+    return {value: (x, y) for x, row in enumerate(goal) for y, value in enumerate(row)}
+
+
+def is_solvable(initial, goal):
+    """
+    Check whether the goal is reachable, using the inversion-parity test.
+    Every slide swaps the blank with a neighbour, flipping the parity of the
+    board's permutation and of the blank's distance to its goal cell at once,
+    so the two parities must agree. Works for any rows x cols board.
     :param initial: Initial state as a 2D tuple.
     :param goal: Goal state as a 2D tuple.
+    :return: True if the initial board can be slid into the goal board.
+    """
+    if len(initial) != len(goal) or len(initial[0]) != len(goal[0]):
+        return False
+    tiles = [value for row in initial for value in row]
+    goal_tiles = [value for row in goal for value in row]
+    if sorted(tiles) != sorted(goal_tiles):
+        return False
+
+    order = {value: index for index, value in enumerate(goal_tiles)}
+    sequence = [order[value] for value in tiles]
+    inversions = sum(
+        1 for i in range(len(sequence)) for j in range(i + 1, len(sequence)) if sequence[i] > sequence[j]
+    )
+    blank_x, blank_y = divmod(tiles.index(0), len(initial[0]))
+    goal_x, goal_y = divmod(goal_tiles.index(0), len(goal[0]))
+    return inversions % 2 == (abs(blank_x - goal_x) + abs(blank_y - goal_y)) % 2
+
+
+def a_star(initial, goal, heuristic_func=None, stats=None):
+    """
+    Solve the sliding puzzle (any rows x cols board) using the A* algorithm.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param heuristic_func: Optional heuristic called as heuristic_func(board, goal),
+                           e.g. a PatternDatabase. Defaults to incremental Manhattan distance.
+    :param stats: Optional SearchStats updated during the search. Heuristic
+                  time covers heuristic_func calls; incremental Manhattan
+                  updates are part of move generation.
     :return: List of moves to reach the goal state.
     """
-    open_list = []
-    closed_set = set()
+    if stats is not None:
+        stats.start()
+        if heuristic_func is not None:
+            heuristic_func = stats.timed(heuristic_func)
+
+    if not is_solvable(initial, goal):
+        if stats is not None:
+            stats.stop(None)
+        return None  # Unreachable goal: reject before searching
+
+    open_list = BucketQueue()
+    closed_set = set()  # Packed codes of expanded boards
+    records = {}  # Packed board -> (cheapest known moves << 2) | direction of the move reaching it
+    positions = goal_positions(goal) if heuristic_func is None else None  # Built once per solve
 
     # Initialize the starting state
     start_state = PuzzleState(initial)
-    heapq.heappush(open_list, (start_state.manhattan_distance(goal) + start_state.moves, start_state))
+    goal_code = start_state.codec.pack(goal)
+    if heuristic_func is None:
+        start_state.heuristic = start_state.manhattan_distance(goal, positions)
+    else:
+        start_state.heuristic = heuristic_func(initial, goal)
+    records[start_state.code] = 0
+    open_list.push(start_state.heuristic + start_state.moves, start_state.moves, start_state)
 
     while open_list:
-        _, current_state = heapq.heappop(open_list)
+        _, _, current_state = open_list.pop()
+
+        # Skip stale entries superseded by a cheaper path or already expanded
+        if current_state.code in closed_set or current_state.moves > records[current_state.code] >> 2:
+            if stats is not None:
+                stats.duplicates += 1
+            continue
 
-        if current_state.board == goal:
-            return reconstruct_path(current_state)
+        if current_state.code == goal_code:
+            moves = trace_moves(records, current_state, start_state.code)
+            path = reconstruct_path(initial, moves)
+            if stats is not None:
+                stats.stop(path)
+            return path
 
-        closed_set.add(current_state)
+        closed_set.add(current_state.code)
 
-        for neighbor in current_state.possible_moves():
-            if neighbor in closed_set:
+        neighbors = current_state.possible_moves(positions)
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += len(neighbors)
+
+        for neighbor in neighbors:
+            record = records.get(neighbor.code)
+            if neighbor.code in closed_set or (record is not None and neighbor.moves >= record >> 2):
+                if stats is not None:
+                    stats.duplicates += 1
                 continue
+            records[neighbor.code] = (neighbor.moves << 2) | neighbor.direction
+            if heuristic_func is not None:
+                neighbor.heuristic = heuristic_func(neighbor.board, goal)
+
+            cost = neighbor.moves + neighbor.heuristic
+            open_list.push(cost, neighbor.moves, neighbor)
 
-            cost = neighbor.moves + neighbor.manhattan_distance(goal)
-            heapq.heappush(open_list, (cost, neighbor))
+        if stats is not None:
+            stats.observe(len(open_list), len(closed_set))
 
+    if stats is not None:
+        stats.stop(None)
     return None  # No solution
 
 
-def reconstruct_path(state):
+def anytime_a_star(initial, goal, weight=3.0, weight_step=0.5, time_limit=None, node_limit=None,
+                   heuristic_func=None):
+    """
+    Anytime weighted A*: yield improving solutions until one is proven optimal or a budget runs out.
+    The search orders nodes by g + weight * h, so a first solution arrives quickly.
+    After each improvement the weight drops by weight_step (never below 1) and
+    the search carries on, pruning every node whose g + h cannot beat the best
+    solution so far and reopening boards reached by a cheaper path.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param weight: Initial heuristic weight.
+    :param weight_step: Amount the weight drops after each improved solution.
+    :param time_limit: Wall-clock budget in seconds, or None for no limit.
+    :param node_limit: Maximum number of node expansions, or None for no limit.
+    :param heuristic_func: Optional admissible heuristic called as heuristic_func(board, goal).
+                           Defaults to incremental Manhattan distance.
+    :return: Generator of (path, bound) pairs. Each path is shorter than the one
+             before and at most `bound` times longer than optimal. A final pair
+             with bound 1.0 repeats the last path once it is proven optimal.
+    """
+    if not is_solvable(initial, goal):
+        return  # No solution
+
+    deadline = None if time_limit is None else time.perf_counter() + time_limit
+    positions = goal_positions(goal) if heuristic_func is None else None
+    start_state = PuzzleState(initial)
+    goal_code = start_state.codec.pack(goal)
+    if heuristic_func is None:
+        start_state.heuristic = start_state.manhattan_distance(goal, positions)
+    else:
+        start_state.heuristic = heuristic_func(initial, goal)
+    if start_state.code == goal_code:
+        yield reconstruct_path(initial, []), 1.0
+        return
+
+    records = {start_state.code: 0}  # Packed board -> (cheapest known moves << 2) | direction
+    counter = count()  # Insertion order, so the heap never compares states
+    open_list = [(weight * start_state.heuristic, 0, next(counter), start_state)]
+    incumbent = math.inf  # Length of the best solution so far
+    best_path = None
+    expansions = 0
+
+    while open_list:
+        if node_limit is not None and expansions >= node_limit:
+            return
+        if deadline is not None and expansions % 64 == 0 and time.perf_counter() >= deadline:
+            return
+
+        _, _, _, current_state = heapq.heappop(open_list)
+        if (current_state.moves > records[current_state.code] >> 2
+                or current_state.moves + current_state.heuristic >= incumbent):
+            continue  # Stale entry, or it cannot lead to a better solution
+        expansions += 1
+
+        for neighbor in current_state.possible_moves(positions):
+            record = records.get(neighbor.code)
+            if record is not None and neighbor.moves >= record >> 2:
+                continue
+            records[neighbor.code] = (neighbor.moves << 2) | neighbor.direction
+            if heuristic_func is not None:
+                neighbor.heuristic = heuristic_func(neighbor.board, goal)
+            if neighbor.moves + neighbor.heuristic >= incumbent:
+                continue
+
+            if neighbor.code == goal_code:
+                incumbent = neighbor.moves
+                best_path = reconstruct_path(initial, trace_moves(records, neighbor, start_state.code))
+
+                # Drop hopeless entries and re-key the rest under the lower weight
+                weight = max(1.0, weight - weight_step)
+                states = [entry[3] for entry in open_list if entry[3].moves + entry[3].heuristic < incumbent]
+                open_list = [(state.moves + weight * state.heuristic, -state.moves, next(counter), state)
+                             for state in states]
+                heapq.heapify(open_list)
+
+                lower = min((state.moves + state.heuristic for state in states), default=incumbent)
+                yield best_path, incumbent / lower
+                continue
+
+            heapq.heappush(open_list, (neighbor.moves + weight * neighbor.heuristic, -neighbor.moves,
+                                       next(counter), neighbor))
+
+    if best_path is not None:
+        yield best_path, 1.0  # Search space exhausted: the incumbent is optimal
+
+
+def anytime_solve(initial, goal, weight=3.0, weight_step=0.5, time_limit=None, node_limit=None,
+                  heuristic_func=None):
+    """
+    Run anytime_a_star until it finishes or its budget runs out.
+    :return: Tuple (best path found, suboptimality bound), or (None, None) if no solution was found in time.
+    """
+    best = (None, None)
+    for best in anytime_a_star(initial, goal, weight, weight_step, time_limit, node_limit, heuristic_func):
+        pass
+    return best
+
+
+def trace_moves(records, state, start_code):
+    """
+    Follow a move table back from a state to the start board.
+    :param records: Dictionary mapping packed boards to a value whose low two
+                    bits are the direction of the move that reached them.
+    :param state: PuzzleState to trace back from.
+    :param start_code: Packed code of the start board.
+    :return: List of direction codes leading from the start board to `state`.
     """
-    Reconstruct the path from the initial state to the goal state.
-    :param state: Final PuzzleState.
+    codec = state.codec
+    code, blank = state.code, state.blank
+    directions = []
+    while code != start_code:
+        direction = records[code] & 3
+        parent_blank = blank - codec.offsets[direction]
+        code = codec.slide(code, blank, parent_blank, codec.tile_at(code, parent_blank))
+        blank = parent_blank
+        directions.append(direction)
+    directions.reverse()
+    return directions
+
+
+def reconstruct_path(initial, directions):
+    """
+    Reconstruct the path by replaying blank moves from the initial state.
+    :param initial: Initial state as a 2D tuple.
+    :param directions: Direction codes of the blank moves, in order.
     :return: List of boards representing the path.
     """
-    path = []
-    while state:
-        path.append(state.board)
-        state = state.previous
-    path.reverse()
+    state = PuzzleState(initial)
+    codec = state.codec
+    code, blank = state.code, state.blank
+    path = [codec.unpack(code)]
+    for direction in directions:
+        index = blank + codec.offsets[direction]
+        code = codec.slide(code, blank, index, codec.tile_at(code, index))
+        blank = index
+        path.append(codec.unpack(code))
     return path
 
 
-# Example: Define the initial and goal states
-initial_state = (
-    (1, 2, 3),
-    (4, 0, 5),
-    (7, 8, 6)
-)
-
-goal_state = (
-    (1, 2, 3),
-    (4, 5, 6),
-    (7, 8, 0)
-)
-
-# Solve the puzzle
-solution_path = a_star(initial_state, goal_state)
-
-# Print the solution path
-if solution_path:
-    print("Solution found! Steps:")
-    for step in solution_path:
-        for row in step:
-            print(row)
-        print()
-else:
-    print("No solution found.")
+def ida_star(initial, goal, heuristic_func=None):
+    """
+    Solve the sliding puzzle (any rows x cols board) using iterative-deepening A*.
+    Only the current path is kept in memory, so memory use is linear in the
+    solution depth. Each iteration is a depth-first search bounded by an f
+    threshold; the next threshold is the smallest f that exceeded the last one.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param heuristic_func: Optional heuristic called as heuristic_func(board, goal).
+                           Defaults to incremental Manhattan distance.
+    :return: List of moves to reach the goal state.
+    """
+    if not is_solvable(initial, goal):
+        return None  # Unreachable goal: the thresholds would grow forever
+
+    start_state = PuzzleState(initial)
+    codec = start_state.codec
+    goal_code = codec.pack(goal)
+    positions = goal_positions(goal)
+    path = [start_state.code]
+    found = -1  # Sentinel returned once the goal has been reached
+
+    def search(code, blank, parent_blank, moves, heuristic, threshold):
+        cost = moves + heuristic
+        if cost > threshold:
+            return cost
+        if code == goal_code:
+            return found
+
+        minimum = math.inf
+        x, y = codec.coords[blank]
+        for index in codec.neighbors[blank]:
+            if index == parent_blank:  # Never slide straight back to the parent
+                continue
+            tile = codec.tile_at(code, index)
+            child = codec.slide(code, blank, index, tile)
+            if heuristic_func is None:
+                nx, ny = codec.coords[index]
+                goal_x, goal_y = positions[tile]
+                child_heuristic = (heuristic
+                                   + abs(x - goal_x) + abs(y - goal_y)
+                                   - abs(nx - goal_x) - abs(ny - goal_y))
+            else:
+                child_heuristic = heuristic_func(codec.unpack(child), goal)
+
+            path.append(child)
+            result = search(child, index, blank, moves + 1, child_heuristic, threshold)
+            if result == found:
+                return found
+            path.pop()
+            minimum = min(minimum, result)
+        return minimum
+
+    if heuristic_func is None:
+        heuristic = start_state.manhattan_distance(goal, positions)
+    else:
+        heuristic = heuristic_func(initial, goal)
+    threshold = heuristic
+    while True:
+        result = search(start_state.code, start_state.blank, None, 0, heuristic, threshold)
+        if result == found:
+            return [codec.unpack(code) for code in path]
+        if result == math.inf:
+            return None  # No solution
+        threshold = result
+
+
+def bidirectional_search(initial, goal):
+    """
+    Solve the sliding puzzle with bidirectional breadth-first search.
+    One frontier grows from the initial board and one from the goal board,
+    a full layer at a time on whichever side is smaller, until they meet.
+    Slides are reversible, so both sides use possible_moves. With complete
+    layers, the first meeting board lies on a shortest path.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :return: List of moves to reach the goal state.
+    """
+    if not is_solvable(initial, goal):
+        return None  # No solution
+
+    start_state = PuzzleState(initial)
+    goal_state = PuzzleState(goal)
+    if start_state == goal_state:
+        return reconstruct_path(initial, [])
+
+    forward = {start_state.code: 0}  # Packed board -> direction of the move reaching it from the start
+    backward = {goal_state.code: 0}  # Packed board -> direction of the move reaching it from the goal
+    forward_frontier = [start_state]
+    backward_frontier = [goal_state]
+
+    while forward_frontier and backward_frontier:
+        grow_forward = len(forward_frontier) <= len(backward_frontier)
+        frontier, visited, other = ((forward_frontier, forward, backward) if grow_forward
+                                    else (backward_frontier, backward, forward))
+
+        next_frontier = []
+        for state in frontier:
+            for neighbor in state.possible_moves():
+                if neighbor.code in visited:
+                    continue
+                visited[neighbor.code] = neighbor.direction
+                next_frontier.append(neighbor)
+
+                if neighbor.code in other:
+                    # The backward moves run goal -> meeting board; undo them in reverse order
+                    forward_moves = trace_moves(forward, neighbor, start_state.code)
+                    backward_moves = trace_moves(backward, neighbor, goal_state.code)
+                    moves = forward_moves + [OPPOSITE[direction] for direction in reversed(backward_moves)]
+                    return reconstruct_path(initial, moves)
+
+        if grow_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    return None  # No solution
+
+
+def default_pattern_groups(goal):
+    """
+    Split the tiles of a goal board into disjoint groups for a pattern database.
+    Tiles are taken in row-major goal order: 4-4 for the 8-puzzle, 6-6-3 for the
+    15-puzzle and groups of six on larger boards.
+    :param goal: Goal state as a 2D tuple.
+    :return: Tuple of tile groups.
+    """
+    tiles = [value for row in goal for value in row if value != 0]
+    width = (len(tiles) + 1) // 2 if len(tiles) <= 8 else 6
+    return tuple(tuple(tiles[i:i + width]) for i in range(0, len(tiles), width))
+
+
+def permutation_rank(cells, size):
+    """
+    Rank an ordered selection of distinct board cells (a partial permutation).
+    :param cells: Sequence of distinct cell indices.
+    :param size: Number of cells on the board.
+    :return: Rank in [0, size! / (size - len(cells))!).
+    """
+    rank = 0
+    for i, cell in enumerate(cells):
+        smaller = 0
+        for j in range(i):
+            if cells[j] < cell:
+                smaller += 1
+        rank = rank * (size - i) + cell - smaller
+    return rank
+
+
+def permutation_unrank(rank, length, size):
+    """
+    Inverse of permutation_rank.
+    :param rank: Rank of the partial permutation.
+    :param length: Number of cells in the selection.
+    :param size: Number of cells on the board.
+    :return: List of cell indices.
+    """
+    digits = [0] * length
+    for i in range(length - 1, -1, -1):
+        rank, digits[i] = divmod(rank, size - i)
+    free = list(range(size))
+    return [free.pop(digit) for digit in digits]
+
+
+def _pattern_header(rows, cols, group, goal):
+    """File header recording the board shape, tile group and goal a table was built for."""
+    return b"PDB1" + bytes([rows, cols, len(group)]) + bytes(group) + bytes(value for row in goal for value in row)
+
+
+def _pattern_table(codec, start_cells):
+    """
+    Backward 0-1 BFS over the abstract space of pattern tiles plus the blank.
+    Only moves of pattern tiles cost 1, which keeps tables from disjoint groups additive.
+    :param codec: BoardCodec of the puzzle.
+    :param start_cells: Goal cells of the pattern tiles, followed by the goal cell of the blank.
+    :return: bytearray of distances indexed by the rank of the pattern tiles' cells.
+    """
+    size = codec.size
+    length = len(start_cells)
+    total = math.perm(size, length)
+    distances = bytearray(b"\xff") * total
+    start = permutation_rank(start_cells, size)
+    distances[start] = 0
+    queue = deque([start])
+
+    while queue:
+        rank = queue.popleft()
+        distance = distances[rank]
+        cells = permutation_unrank(rank, length, size)
+        blank = cells[-1]
+
+        for index in codec.neighbors[blank]:
+            child_cells = cells[:]
+            child_cells[-1] = index
+            cost = 0
+            for t in range(length - 1):
+                if cells[t] == index:  # A pattern tile slides into the blank
+                    child_cells[t] = blank
+                    cost = 1
+                    break
+            child = permutation_rank(child_cells, size)
+            if distance + cost < distances[child]:
+                distances[child] = distance + cost
+                if cost:
+                    queue.append(child)
+                else:
+                    queue.appendleft(child)
+
+    # Drop the blank: keep the best distance over all of its positions
+    width = size - length + 1
+    return bytearray(min(distances[i:i + width]) for i in range(0, total, width))
+
+
+def build_pattern_database(goal, groups=None, directory="."):
+    """
+    Build an additive disjoint pattern database and write its tables to disk.
+    Each group gets one file holding a byte per placement of its tiles.
+    :param goal: Goal state as a 2D tuple.
+    :param groups: Disjoint tile groups, e.g. a 6-6-3 split for the 15-puzzle.
+    :param directory: Directory the table files are written to.
+    :return: PatternDatabase reading the written tables.
+    """
+    database = PatternDatabase(goal, groups, directory)
+    codec = database.codec
+    cells = {value: x * codec.cols + y for value, (x, y) in goal_positions(goal).items()}
+    os.makedirs(directory, exist_ok=True)
+
+    for group, path in zip(database.groups, database.paths):
+        table = _pattern_table(codec, [cells[tile] for tile in group] + [cells[0]])
+        with open(path, "wb") as handle:
+            handle.write(_pattern_header(codec.rows, codec.cols, group, goal))
+            handle.write(table)
+    return database
+
+
+class PatternDatabase:
+    """
+    Additive disjoint pattern-database heuristic backed by memory-mapped tables.
+    Tables are mapped read-only on first use, so processes using the same files
+    share their pages; pickling an instance only carries the file paths.
+    """
+
+    def __init__(self, goal, groups=None, directory="."):
+        """
+        Initialize the heuristic without touching the table files.
+        :param goal: Goal state as a 2D tuple.
+        :param groups: Disjoint tile groups; defaults to default_pattern_groups(goal).
+        :param directory: Directory holding the table files.
+        """
+        self.goal = goal
+        self.groups = tuple(tuple(group) for group in (groups or default_pattern_groups(goal)))
+        self.codec = board_codec(len(goal), len(goal[0]))
+        self.paths = [
+            os.path.join(directory, f"pdb-{self.codec.rows}x{self.codec.cols}-{'-'.join(map(str, group))}.bin")
+            for group in self.groups
+        ]
+        self._tables = None
+
+    @property
+    def tables(self):
+        """Memory-mapped distance tables, one per group, mapped on first access."""
+        if self._tables is None:
+            tables = []
+            for group, path in zip(self.groups, self.paths):
+                with open(path, "rb") as handle:
+                    mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+                header = _pattern_header(self.codec.rows, self.codec.cols, group, self.goal)
+                if mapped[:len(header)] != header:
+                    raise ValueError(f"{path} was not built for this goal and tile group")
+                tables.append(memoryview(mapped)[len(header):])
+            self._tables = tables
+        return self._tables
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_tables"] = None  # Workers map the files themselves
+        return state
+
+    def __call__(self, board, goal=None):
+        """
+        Heuristic value of a board: the sum of its per-group table entries.
+        :param board: 2D tuple representing the puzzle board.
+        :param goal: Ignored; the tables were built for self.goal.
+        :return: Admissible estimate of the moves left.
+        """
+        locations = [0] * self.codec.size
+        for index, value in enumerate(value for row in board for value in row):
+            locations[value] = index
+        size = self.codec.size
+        return sum(
+            table[permutation_rank([locations[tile] for tile in group], size)]
+            for group, table in zip(self.groups, self.tables)
+        )
+
+
+def _oracle_header(goal):
+    """File header recording the board shape and goal a distance oracle was built for."""
+    return b"ORC1" + bytes([len(goal), len(goal[0])]) + bytes(value for row in goal for value in row)
+
+
+def build_distance_oracle(goal, path):
+    """
+    Record the exact distance to the goal of every reachable board and save it.
+    A retrograde BFS from the goal fills one byte per permutation of the tiles,
+    indexed by its Lehmer-code rank; unreachable permutations keep 255. Meant
+    for small boards such as the 8-puzzle (9! bytes, 181,440 of them reachable).
+    :param goal: Goal state as a 2D tuple.
+    :param path: File the table is written to.
+    :return: DistanceOracle over the new table.
+    """
+    codec = board_codec(len(goal), len(goal[0]))
+    size = codec.size
+    table = bytearray(b"\xff") * math.factorial(size)
+    start = permutation_rank([value for row in goal for value in row], size)
+    table[start] = 0
+    queue = deque([start])
+
+    while queue:
+        rank = queue.popleft()
+        distance = table[rank]
+        values = permutation_unrank(rank, size, size)
+        blank = values.index(0)
+        for index in codec.neighbors[blank]:
+            values[blank], values[index] = values[index], 0
+            child = permutation_rank(values, size)
+            if table[child] == 255:
+                table[child] = distance + 1
+                queue.append(child)
+            values[index], values[blank] = values[blank], 0
+
+    with open(path, "wb") as handle:
+        handle.write(_oracle_header(goal))
+        handle.write(table)
+    return DistanceOracle(goal, table)
+
+
+class DistanceOracle:
+    """
+    Exact goal distances for every board, looked up by permutation rank.
+    Can be passed to a_star as heuristic_func, or used directly through solve,
+    which needs only one lookup per neighbour along an optimal path.
+    """
+
+    def __init__(self, goal, table):
+        """
+        Initialize the oracle from an in-memory table.
+        :param goal: Goal state as a 2D tuple.
+        :param table: Distance table indexed by permutation rank.
+        """
+        self.goal = goal
+        self.table = table
+        self.codec = board_codec(len(goal), len(goal[0]))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a table written by build_distance_oracle.
+        :param path: File the table was written to.
+        :return: DistanceOracle for the goal recorded in the file.
+        """
+        with open(path, "rb") as handle:
+            data = handle.read()
+        if not data.startswith(b"ORC1"):
+            raise ValueError(f"{path} is not a distance oracle table")
+        rows, cols = data[4], data[5]
+        values = data[6:6 + rows * cols]
+        goal = tuple(tuple(values[x * cols:(x + 1) * cols]) for x in range(rows))
+        return cls(goal, memoryview(data)[len(_oracle_header(goal)):])
+
+    def distance(self, board):
+        """
+        Exact number of moves from a board to the goal.
+        :param board: 2D tuple representing the puzzle board.
+        :return: Distance, or None if the goal is unreachable.
+        """
+        distance = self.table[permutation_rank([value for row in board for value in row], self.codec.size)]
+        return None if distance == 255 else distance
+
+    def __call__(self, board, goal=None):
+        """Heuristic form of distance(); `goal` is ignored."""
+        return self.distance(board)
+
+    def solve(self, initial):
+        """
+        Solve optimally by greedy descent: always step to a neighbour one move closer.
+        :param initial: Initial state as a 2D tuple.
+        :return: List of boards representing the path, or None if unsolvable.
+        """
+        distance = self.distance(initial)
+        if distance is None:
+            return None  # No solution
+
+        codec = self.codec
+        values = [value for row in initial for value in row]
+        blank = values.index(0)
+        path = [tuple(tuple(row) for row in initial)]
+        while distance:
+            for index in codec.neighbors[blank]:
+                values[blank], values[index] = values[index], 0
+                if self.table[permutation_rank(values, codec.size)] == distance - 1:
+                    blank = index
+                    distance -= 1
+                    break
+                values[index], values[blank] = values[blank], 0
+            path.append(tuple(tuple(values[x * codec.cols:(x + 1) * codec.cols]) for x in range(codec.rows)))
+        return path
+
+
+def _init_batch_worker(solver, heuristic_func):
+    """Store the solver and heuristic once per worker process."""
+    global _batch_solver, _batch_heuristic
+    _batch_solver = solver
+    _batch_heuristic = heuristic_func
+
+
+def _solve_chunk(chunk):
+    """
+    Solve one chunk of numbered instances inside a worker process.
+    :param chunk: List of (index, (initial, goal)) pairs.
+    :return: List of (index, path, stats) tuples.
+    """
+    results = []
+    for index, (initial, goal) in chunk:
+        started = time.perf_counter()
+        if _batch_heuristic is None:
+            path = _batch_solver(initial, goal)
+        else:
+            path = _batch_solver(initial, goal, _batch_heuristic)
+        stats = {
+            "moves": len(path) - 1 if path else None,
+            "seconds": time.perf_counter() - started,
+            "worker": os.getpid(),
+        }
+        results.append((index, path, stats))
+    return results
+
+
+def solve_batch(instances, solver=None, heuristic_func=None, max_workers=None, chunksize=8):
+    """
+    Solve many puzzle instances on a process pool.
+    Instances are sent to workers in chunks, and each worker receives the
+    solver and heuristic once. A PatternDatabase pickles as file paths only,
+    so every worker maps the same table files read-only instead of getting
+    its own copy. Only a few chunks per worker are in flight at any time,
+    so `instances` may be a long or lazy iterable.
+    :param instances: Iterable of (initial, goal) pairs of 2D tuples.
+    :param solver: Solver called as solver(initial, goal[, heuristic_func]); defaults to a_star.
+    :param heuristic_func: Optional heuristic passed to the solver.
+    :param max_workers: Number of worker processes; defaults to the CPU count.
+    :param chunksize: Number of instances per task.
+    :return: Generator of (index, path, stats) tuples in completion order, where
+             index is the instance's position in `instances` and stats holds
+             the solution length, solve time and worker pid.
+    """
+    solver = solver or a_star
+    max_workers = max_workers or os.cpu_count() or 1
+    numbered = enumerate(instances)
+    chunks = iter(lambda: list(islice(numbered, chunksize)), [])
+
+    with ProcessPoolExecutor(max_workers, initializer=_init_batch_worker,
+                             initargs=(solver, heuristic_func)) as executor:
+        pending = {executor.submit(_solve_chunk, chunk) for chunk in islice(chunks, 2 * max_workers)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                chunk = next(chunks, None)
+                if chunk is not None:
+                    pending.add(executor.submit(_solve_chunk, chunk))
+
+
+if __name__ == "__main__":
+    # Example: Define the initial and goal states
+    initial_state = (
+        (1, 2, 3),
+        (4, 0, 5),
+        (7, 8, 6)
+    )
+
+    goal_state = (
+        (1, 2, 3),
+        (4, 5, 6),
+        (7, 8, 0)
+    )
+
+    # Solve the puzzle
+    solution_path = a_star(initial_state, goal_state)
+
+    # Print the solution path
+    if solution_path:
+        print("Solution found! Steps:")
+        for step in solution_path:
+            for row in step:
+                print(row)
+            print()
+    else:
+        print("No solution found.")
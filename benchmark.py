@@ -0,0 +1,301 @@
+import argparse
+import importlib
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+from blockworld import BlockWorld
+from hillclimbing import linear_conflict, manhattan_distance, steepest_ascent_hill_climbing, walking_distance
+from searchstats import SearchStats
+from waterjug import WaterJug
+
+puzzle = importlib.import_module("8puzzle")  # The module name is not a valid identifier
+
+GOAL_8 = ((1, 2, 3), (4, 5, 6), (7, 8, 0))
+GOAL_15 = ((1, 2, 3, 4), (5, 6, 7, 8), (9, 10, 11, 12), (13, 14, 15, 0))
+GOAL_KORF = ((0, 1, 2, 3), (4, 5, 6, 7), (8, 9, 10, 11), (12, 13, 14, 15))  # Blank top-left, as in Korf (1985)
+
+HEURISTICS = {
+    "manhattan": None,  # Solvers fall back to incremental Manhattan distance
+    "linear_conflict": linear_conflict,
+    "walking_distance": walking_distance,
+}
+
+
+def _hill_climbing(instance, heuristic, stats):
+    path, success = steepest_ascent_hill_climbing(*instance, heuristic or manhattan_distance, stats)
+    return path if success else None
+
+
+# Solver name -> (callable(instance, heuristic, stats) returning a path or None, updates SearchStats?)
+SOLVERS = {
+    "a_star": (lambda instance, heuristic, stats: puzzle.a_star(*instance, heuristic, stats), True),
+    "ida_star": (lambda instance, heuristic, stats: puzzle.ida_star(*instance, heuristic), False),
+    "bidirectional_search": (lambda instance, heuristic, stats: puzzle.bidirectional_search(*instance), False),
+    "hill_climbing": (_hill_climbing, True),
+    "blockworld_bfs": (lambda instance, heuristic, stats: BlockWorld(*instance).bfs(stats), True),
+    "blockworld_bidirectional": (lambda instance, heuristic, stats: BlockWorld(*instance).bidirectional_search(),
+                                 False),
+    "blockworld_a_star": (lambda instance, heuristic, stats: BlockWorld(*instance).a_star(stats=stats), True),
+    "blockworld_greedy": (lambda instance, heuristic, stats: BlockWorld(*instance).greedy_search(stats=stats), True),
+    "waterjug_bfs": (lambda instance, heuristic, stats: WaterJug(*instance).bfs(stats), True),
+    "waterjug_bidirectional": (lambda instance, heuristic, stats: WaterJug(*instance).bidirectional_search(), False),
+}
+
+
+def _rng(seed, corpus):
+    """Independent, reproducible random generator for one corpus."""
+    return random.Random(f"{seed}:{corpus}")
+
+
+def _board(values, cols):
+    return tuple(tuple(values[x:x + cols]) for x in range(0, len(values), cols))
+
+
+def eight_puzzle_corpora(seed, depths, per_depth):
+    """
+    Random solvable 8-puzzles grouped by exact optimal depth.
+    Depths come from the distance oracle, which is built once and cached in
+    the temporary directory.
+    :return: Dictionary mapping corpus names to lists of (initial, goal) pairs.
+    """
+    path = os.path.join(tempfile.gettempdir(), "8puzzle-oracle.bin")
+    if os.path.exists(path):
+        oracle = puzzle.DistanceOracle.load(path)
+    else:
+        oracle = puzzle.build_distance_oracle(GOAL_8, path)
+
+    ranks = {depth: [] for depth in depths}
+    for rank, distance in enumerate(oracle.table):
+        if distance in ranks:
+            ranks[distance].append(rank)
+
+    corpora = {}
+    for depth in depths:
+        name = f"8puzzle/depth-{depth}"
+        chosen = _rng(seed, name).sample(ranks[depth], min(per_depth, len(ranks[depth])))
+        corpora[name] = [(_board(puzzle.permutation_unrank(rank, 9, 9), 3), GOAL_8) for rank in sorted(chosen)]
+    return corpora
+
+
+def fifteen_puzzle_corpora(seed, walk_lengths, count):
+    """
+    Solvable 15-puzzles scrambled by seeded random walks (no immediate reversals).
+    :return: Dictionary mapping corpus names to lists of (initial, goal) pairs.
+    """
+    codec = puzzle.board_codec(4, 4)
+    corpora = {}
+    for length in walk_lengths:
+        name = f"15puzzle/walk-{length}"
+        rng = _rng(seed, name)
+        instances = []
+        for _ in range(count):
+            state = puzzle.PuzzleState(GOAL_15)
+            code, blank, previous = state.code, state.blank, None
+            for _ in range(length):
+                index = rng.choice([index for index in codec.neighbors[blank] if index != previous])
+                code = codec.slide(code, blank, index, codec.tile_at(code, index))
+                previous, blank = blank, index
+            instances.append((codec.unpack(code), GOAL_15))
+        corpora[name] = instances
+    return corpora
+
+
+def load_korf100(path):
+    """
+    Read the Korf (1985) 15-puzzle instances from a text file.
+    Each line holds the 16 tiles in row-major order with 0 as the blank,
+    optionally preceded by the instance number. The goal has the blank in
+    the top-left corner.
+    :return: List of (initial, goal) pairs.
+    """
+    instances = []
+    with open(path) as handle:
+        for line in handle:
+            values = [int(token) for token in line.split()]
+            if len(values) >= 16:
+                instances.append((_board(values[-16:], 4), GOAL_KORF))
+    return instances
+
+
+def blockworld_corpora(seed, block_counts, count, stacks=3):
+    """
+    Random BlockWorld instances with a given number of blocks over `stacks` stacks.
+    :return: Dictionary mapping corpus names to lists of (initial, goal) pairs.
+    """
+    corpora = {}
+    for blocks in block_counts:
+        name = f"blockworld/{blocks}-blocks"
+        rng = _rng(seed, name)
+        labels = [chr(ord("A") + i) for i in range(blocks)]
+
+        def arrangement():
+            piles = [[] for _ in range(stacks)]
+            for label in rng.sample(labels, blocks):
+                piles[rng.randrange(stacks)].append(label)
+            return tuple(tuple(pile) for pile in piles)
+
+        corpora[name] = [(arrangement(), arrangement()) for _ in range(count)]
+    return corpora
+
+
+def waterjug_corpora(seed, capacities, count):
+    """
+    WaterJug instances starting from empty jugs, with goals drawn from the reachable states.
+    :return: Dictionary mapping corpus names to lists of (initial, goal, capacities) triples.
+    """
+    corpora = {}
+    for capacity in capacities:
+        name = f"waterjug/{capacity[0]}x{capacity[1]}"
+        problem = WaterJug((0, 0), None, capacity)
+        reachable = {(0, 0)}
+        frontier = [(0, 0)]
+        while frontier:
+            state = frontier.pop()
+            for successor in problem.successor(state):
+                if successor not in reachable:
+                    reachable.add(successor)
+                    frontier.append(successor)
+        goals = _rng(seed, name).sample(sorted(reachable), min(count, len(reachable)))
+        corpora[name] = [((0, 0), goal, capacity) for goal in goals]
+    return corpora
+
+
+def run_case(case):
+    """
+    Run one solver/heuristic pair over one corpus; meant to run in a fresh process.
+    :param case: Dictionary with corpus, solver, heuristic and instances.
+    :return: Dictionary of results for the case.
+    """
+    solve, instrumented = SOLVERS[case["solver"]]
+    heuristic = HEURISTICS[case["heuristic"]] if case["heuristic"] else None
+    solved = moves = generated = expanded = 0
+    seconds = 0.0
+
+    for instance in case["instances"]:
+        stats = SearchStats() if instrumented else None
+        started = time.perf_counter()
+        path = solve(instance, heuristic, stats)
+        seconds += time.perf_counter() - started
+        if path:
+            solved += 1
+            moves += len(path) - 1
+        if stats is not None:
+            generated += stats.generated
+            expanded += stats.expanded
+
+    peak_rss = None
+    if resource is not None:
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        if sys.platform == "darwin":
+            peak_rss //= 1024  # Reported in bytes there, KiB elsewhere
+
+    return {
+        "corpus": case["corpus"],
+        "solver": case["solver"],
+        "heuristic": case["heuristic"],
+        "instances": len(case["instances"]),
+        "solved": solved,
+        "total_moves": moves,
+        "seconds": round(seconds, 6),
+        "generated": generated if instrumented else None,
+        "expanded": expanded if instrumented else None,
+        "nodes_per_second": round(generated / seconds) if instrumented and seconds else None,
+        "peak_rss_kib": peak_rss,
+    }
+
+
+def build_cases(seed, quick=False, korf100=None):
+    """
+    Assemble every (corpus, solver, heuristic) case of the suite.
+    :param seed: Seed all corpora are derived from.
+    :param quick: Use smaller corpora for a fast smoke run.
+    :param korf100: Optional path to the Korf 100 instance file.
+    :return: List of case dictionaries.
+    """
+    depths = (4, 8, 12, 16) if quick else (4, 8, 12, 16, 20, 24, 28)
+    plans = []
+
+    for corpus, instances in eight_puzzle_corpora(seed, depths, 3 if quick else 10).items():
+        for solver, heuristic in [("a_star", "manhattan"), ("a_star", "linear_conflict"),
+                                  ("a_star", "walking_distance"), ("ida_star", "manhattan"),
+                                  ("ida_star", "linear_conflict"), ("bidirectional_search", None),
+                                  ("hill_climbing", "manhattan"), ("hill_climbing", "linear_conflict")]:
+            plans.append((corpus, solver, heuristic, instances))
+
+    walks = (20, 30) if quick else (20, 30, 40)
+    for corpus, instances in fifteen_puzzle_corpora(seed, walks, 3 if quick else 10).items():
+        for solver, heuristic in [("a_star", "manhattan"), ("a_star", "linear_conflict"),
+                                  ("ida_star", "linear_conflict")]:
+            plans.append((corpus, solver, heuristic, instances))
+
+    if korf100:
+        plans.append(("15puzzle/korf100", "ida_star", "linear_conflict", load_korf100(korf100)))
+
+    counts = (3, 4, 5) if quick else (3, 4, 5, 6, 7)
+    for corpus, instances in blockworld_corpora(seed, counts, 3 if quick else 5).items():
+        for solver in ("blockworld_bfs", "blockworld_bidirectional", "blockworld_a_star", "blockworld_greedy"):
+            plans.append((corpus, solver, None, instances))
+
+    capacities = [(4, 3), (5, 3), (7, 5)] if quick else [(4, 3), (5, 3), (7, 5), (9, 4), (13, 7), (31, 17)]
+    for corpus, instances in waterjug_corpora(seed, capacities, 3 if quick else 5).items():
+        for solver in ("waterjug_bfs", "waterjug_bidirectional"):
+            plans.append((corpus, solver, None, instances))
+
+    return [{"corpus": corpus, "solver": solver, "heuristic": heuristic, "instances": instances}
+            for corpus, solver, heuristic, instances in plans]
+
+
+def run_benchmark(seed=0, quick=False, korf100=None, pattern=None):
+    """
+    Run the suite, each case in its own process so peak RSS is per case.
+    :param seed: Seed all corpora are derived from.
+    :param quick: Use smaller corpora for a fast smoke run.
+    :param korf100: Optional path to the Korf 100 instance file.
+    :param pattern: Optional substring; only cases whose corpus or solver contains it run.
+    :return: JSON-serialisable report.
+    """
+    cases = build_cases(seed, quick, korf100)
+    if pattern:
+        cases = [case for case in cases if pattern in case["corpus"] or pattern in case["solver"]]
+
+    with get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+        results = [pool.apply(run_case, (case,)) for case in cases]
+
+    return {
+        "meta": {
+            "seed": seed,
+            "quick": quick,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the search solvers on fixed-seed instance sets.")
+    parser.add_argument("--seed", type=int, default=0, help="seed all corpora are derived from")
+    parser.add_argument("--quick", action="store_true", help="use small corpora for a smoke run")
+    parser.add_argument("--korf100", help="path to the Korf 100 15-puzzle instance file")
+    parser.add_argument("--only", help="run only cases whose corpus or solver contains this text")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+
+    report = json.dumps(run_benchmark(args.seed, args.quick, args.korf100, args.only), indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
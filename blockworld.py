@@ -1,4 +1,50 @@
+import heapq
+import os
+import tempfile
 from collections import deque
+from itertools import count
+
+from blockworldheuristic import IncrementalHeuristic
+
+
+def _read_records(path, width, batch=4096):
+    """Stream fixed-width records from a file, reading `batch` records at a time."""
+    with open(path, "rb") as handle:
+        while True:
+            data = handle.read(width * batch)
+            if not data:
+                return
+            for start in range(0, len(data), width):
+                yield data[start:start + width]
+
+
+def _merge_layer(run_paths, exclude_paths, out_path, width, goal_record):
+    """
+    Merge sorted run files into one sorted, duplicate-free layer file.
+    Records that also appear in any of the sorted `exclude_paths` files are dropped.
+    :return: Tuple (number of records written, whether goal_record was written).
+    """
+    seen = heapq.merge(*(_read_records(path, width) for path in exclude_paths))
+    seen_record = next(seen, None)
+    previous = None
+    written = 0
+    found = False
+
+    with open(out_path, "wb") as handle:
+        for record in heapq.merge(*(_read_records(path, width) for path in run_paths)):
+            if record == previous:
+                continue
+            previous = record
+            while seen_record is not None and seen_record < record:
+                seen_record = next(seen, None)
+            if record == seen_record:
+                continue
+            handle.write(record)
+            written += 1
+            if record == goal_record:
+                found = True
+    return written, found
+
 
 class BlockWorld:
     def __init__(self, initial_state, goal_state):
@@ -9,6 +55,8 @@ class BlockWorld:
         """
         self.initial_state = initial_state
         self.goal_state = goal_state
+        # Stacks the goal leaves empty: their contents can be swapped without changing the distance to the goal
+        self.free_stacks = [index for index, stack in enumerate(goal_state) if not stack]
 
     def goal_test(self, state):
         """Check if the current state matches the goal state."""
@@ -20,29 +68,68 @@ class BlockWorld:
         :param state: Current state represented as a tuple of stacks.
         :return: List of successor states.
         """
-        successors = []
-        n = len(state)  # Number of stacks (including table)
+        return list(self.iter_successors(tuple(tuple(stack) for stack in state)))
 
-        # Iterate over each stack and generate moves
-        for i in range(n):
-            if state[i]:  # If stack `i` is not empty
-                # Remove the top block from stack `i`
-                new_state = [list(stack) for stack in state]  # Create a deep copy
-                block = new_state[i].pop()
+    def iter_successors(self, state):
+        """
+        Yield successor states one at a time, in the same order as successor.
+        Only the two stacks a move touches are rebuilt; every other stack tuple
+        is shared with `state`.
+        :param state: Current state as a tuple of stack tuples.
+        :return: Generator of successor states.
+        """
+        return (successor for _, _, successor in self.iter_moves(state))
 
+    def iter_moves(self, state):
+        """
+        Yield (source stack, target stack, successor state) for every move, lazily.
+        :param state: Current state as a tuple of stack tuples.
+        :return: Generator of moves.
+        """
+        n = len(state)  # Number of stacks (including table)
+        for i, stack in enumerate(state):
+            if stack:  # If stack `i` is not empty
+                block = stack[-1]
+                remaining = stack[:-1]
                 for j in range(n):  # Move the block to each other stack
-                    if i != j:  # Avoid moving to the same stack
-                        new_stack_state = [list(stack) for stack in new_state]
-                        new_stack_state[j].append(block)  # Add block to stack `j`
-                        successors.append(tuple(tuple(stack) for stack in new_stack_state))
+                    if i != j:
+                        new_state = list(state)
+                        new_state[i] = remaining
+                        new_state[j] = state[j] + (block,)
+                        yield i, j, tuple(new_state)
 
-        return successors
+    def canonical(self, state):
+        """
+        Map a state to the key shared by all states that differ only in which
+        free stack (one the goal leaves empty) holds which tower: the free
+        stacks' contents are sorted into the free positions.
+        Moves act the same way on every free stack, so all states with one key
+        are equally far from the goal, and only the goal itself has the goal's key.
+        :param state: State as a tuple of stack tuples.
+        :return: Canonical key, itself a state.
+        """
+        free_stacks = self.free_stacks
+        if len(free_stacks) < 2:
+            return state
+        key = list(state)
+        for index, stack in zip(free_stacks, sorted(state[index] for index in free_stacks)):
+            key[index] = stack
+        return tuple(key)
 
-    def bfs(self):
+    def bfs(self, stats=None, symmetric=False):
         """
         Perform BFS to find the solution.
+        :param stats: Optional SearchStats updated during the search.
+        :param symmetric: Deduplicate states by their canonical key, so states
+                          that differ only in the order of free stacks are
+                          explored once. The queue still holds concrete states,
+                          so the returned path uses real stack indices.
         :return: List of states representing the solution path.
         """
+        if stats is not None:
+            stats.start()
+        key = self.canonical if symmetric else None
+
         open_list = deque()  # BFS queue
         closed_list = set()  # Visited states
         parent_map = {}  # Track parent states
@@ -50,7 +137,7 @@ class BlockWorld:
         # Initialize BFS
         initial_state = tuple(tuple(stack) for stack in self.initial_state)
         open_list.append(initial_state)
-        closed_list.add(initial_state)
+        closed_list.add(key(initial_state) if key else initial_state)
         parent_map[initial_state] = None
 
         while open_list:
@@ -58,17 +145,289 @@ class BlockWorld:
 
             # Check if the goal state is reached
             if self.goal_test(current_state):
-                return self.generate_path(parent_map, current_state)
+                path = self.generate_path(parent_map, current_state)
+                if stats is not None:
+                    stats.stop(path)
+                return path
 
             # Generate and explore successors
-            for successor in self.successor(current_state):
-                if successor not in closed_list:
+            generated = 0
+            for successor in self.iter_successors(current_state):
+                generated += 1
+                successor_key = key(successor) if key else successor
+                if successor_key not in closed_list:
                     open_list.append(successor)
-                    closed_list.add(successor)
+                    closed_list.add(successor_key)
                     parent_map[successor] = current_state
+                elif stats is not None:
+                    stats.duplicates += 1
+
+            if stats is not None:
+                stats.expanded += 1
+                stats.generated += generated
+                stats.observe(len(open_list), len(closed_list))
+
+        if stats is not None:
+            stats.stop(None)
+        return None  # No solution found
+
+    def a_star(self, heuristic_func=None, stats=None, symmetric=False):
+        """
+        Perform A* search; each move costs 1.
+        :param heuristic_func: Heuristic called as heuristic_func(state, goal);
+                               admissible ones such as blocks_out_of_place give
+                               shortest paths. Defaults to an incremental
+                               blocks_out_of_place.
+        :param stats: Optional SearchStats updated during the search.
+        :param symmetric: Deduplicate states by their canonical key, as in bfs.
+        :return: List of states representing the solution path.
+        """
+        if heuristic_func is None:
+            heuristic_func = IncrementalHeuristic(self.goal_state)
+        return self.best_first_search(heuristic_func, False, stats, symmetric)
+
+    def greedy_search(self, heuristic_func=None, stats=None, symmetric=False):
+        """
+        Perform greedy best-first search, ordered by the heuristic alone.
+        The default orders states by the score from calculate_heuristic,
+        updated incrementally. Paths are not guaranteed to be shortest.
+        :param heuristic_func: Heuristic called as heuristic_func(state, goal).
+        :param stats: Optional SearchStats updated during the search.
+        :param symmetric: Deduplicate states by their canonical key, as in bfs.
+        :return: List of states representing the solution path.
+        """
+        if heuristic_func is None:
+            heuristic_func = IncrementalHeuristic(self.goal_state, admissible=False)
+        return self.best_first_search(heuristic_func, True, stats, symmetric)
+
+    def best_first_search(self, heuristic_func, greedy, stats=None, symmetric=False):
+        """
+        Shared loop of a_star and greedy_search.
+        States are ordered by g + h (ties to the deeper state), or by h alone
+        when greedy. A* keeps the cheapest known g per state and skips stale
+        queue entries; greedy search keeps the first path found to each state.
+        An IncrementalHeuristic scores each child from its parent's value and
+        the moved block instead of rescanning the child.
+        :return: List of states representing the solution path.
+        """
+        incremental = isinstance(heuristic_func, IncrementalHeuristic)
+        evaluate = heuristic_func.evaluate if incremental else None
+        update = heuristic_func.update if incremental else None
+        if stats is not None:
+            stats.start()
+            if incremental:
+                evaluate, update = stats.timed(evaluate), stats.timed(update)
+            else:
+                heuristic_func = stats.timed(heuristic_func)
+        key = self.canonical if symmetric else None
+
+        initial_state = tuple(tuple(stack) for stack in self.initial_state)
+        goal_state = tuple(tuple(stack) for stack in self.goal_state)
+        if incremental:
+            h, extra = evaluate(initial_state)  # `extra` is the per-state data update needs
+        else:
+            h, extra = heuristic_func(initial_state, goal_state), None
+        tie = count()  # Keeps heap entries comparable without comparing states
+        open_list = [(h, 0, next(tie), 0, initial_state, h, extra)]
+        best_g = {key(initial_state) if key else initial_state: 0}
+        closed_list = set()
+        parent_map = {initial_state: None}
+
+        while open_list:
+            _, _, _, g, current_state, h, extra = heapq.heappop(open_list)
+            current_key = key(current_state) if key else current_state
+            if current_key in closed_list:
+                if stats is not None:
+                    stats.duplicates += 1
+                continue
+            closed_list.add(current_key)
+
+            if self.goal_test(current_state):
+                path = self.generate_path(parent_map, current_state)
+                if stats is not None:
+                    stats.stop(path)
+                return path
+
+            generated = 0
+            for source, target, successor in self.iter_moves(current_state):
+                generated += 1
+                successor_key = key(successor) if key else successor
+                if successor_key in closed_list or (successor_key in best_g if greedy
+                                                    else best_g.get(successor_key, g + 2) <= g + 1):
+                    if stats is not None:
+                        stats.duplicates += 1
+                    continue
+                best_g[successor_key] = g + 1
+                parent_map[successor] = current_state
+                if incremental:
+                    child_h, child_extra = update(h, extra, current_state, source, target)
+                else:
+                    child_h, child_extra = heuristic_func(successor, goal_state), None
+                heapq.heappush(open_list, (child_h if greedy else g + 1 + child_h, -g - 1, next(tie), g + 1,
+                                           successor, child_h, child_extra))
 
+            if stats is not None:
+                stats.expanded += 1
+                stats.generated += generated
+                stats.observe(len(open_list), len(closed_list))
+
+        if stats is not None:
+            stats.stop(None)
         return None  # No solution found
 
+    def bidirectional_search(self):
+        """
+        Perform bidirectional BFS, growing one frontier from the initial state and
+        one from the goal state a full layer at a time until they meet.
+        Block moves are reversible, so the backward search uses successor too.
+        :return: List of states representing the solution path.
+        """
+        initial_state = tuple(tuple(stack) for stack in self.initial_state)
+        goal_state = tuple(tuple(stack) for stack in self.goal_state)
+        if initial_state == goal_state:
+            return [initial_state]
+
+        forward_parents = {initial_state: None}  # Parent of each state reached from the start
+        backward_parents = {goal_state: None}  # Next state toward the goal for each state reached from it
+        forward_frontier = [initial_state]
+        backward_frontier = [goal_state]
+
+        while forward_frontier and backward_frontier:
+            # Expand the smaller frontier by one full layer
+            grow_forward = len(forward_frontier) <= len(backward_frontier)
+            frontier, parent_map, other_map = ((forward_frontier, forward_parents, backward_parents) if grow_forward
+                                               else (backward_frontier, backward_parents, forward_parents))
+
+            next_frontier = []
+            for current_state in frontier:
+                for successor in self.iter_successors(current_state):
+                    if successor not in parent_map:
+                        parent_map[successor] = current_state
+                        next_frontier.append(successor)
+                        if successor in other_map:  # Frontiers met
+                            return self.join_paths(forward_parents, backward_parents, successor)
+
+            if grow_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return None  # No solution found
+
+    def join_paths(self, forward_parents, backward_parents, meeting_state):
+        """
+        Join the two halves of a bidirectional search at the state where they met.
+        :param forward_parents: Parent map of the search from the initial state.
+        :param backward_parents: Parent map of the search from the goal state.
+        :param meeting_state: State reached by both searches.
+        :return: List of states representing the solution path.
+        """
+        forward_path = self.generate_path(forward_parents, meeting_state)
+        backward_path = self.generate_path(backward_parents, meeting_state)
+        return forward_path + backward_path[-2::-1]
+
+    def external_bfs(self, directory=None, chunk_size=100000):
+        """
+        Perform a disk-backed, level-synchronous BFS.
+        Each layer is a sorted file of fixed-width records. Successors of a layer
+        are sorted in runs of at most chunk_size records, then merged in one
+        sequential pass that drops duplicates and anything in the two previous
+        layers. Block moves are reversible, so no older layer can hold a new
+        state. The path is rebuilt by scanning the layers backward for a
+        neighbour of the current state.
+        :param directory: Directory for the layer files; a temporary directory is created inside it.
+        :param chunk_size: Maximum number of successor records sorted in memory at once.
+        :return: List of states representing the solution path.
+        """
+        initial_state = tuple(tuple(stack) for stack in self.initial_state)
+        if self.goal_test(initial_state):
+            return [initial_state]
+
+        blocks = sorted(block for stack in initial_state for block in stack)
+        if blocks != sorted(block for stack in self.goal_state for block in stack):
+            return None  # The goal holds different blocks
+
+        with tempfile.TemporaryDirectory(dir=directory) as workdir:
+            layer_paths = [os.path.join(workdir, "layer-0.bin")]
+            with open(layer_paths[0], "wb") as handle:
+                handle.write(self.encode(initial_state, blocks))
+            goal_record = self.encode(self.goal_state, blocks)
+
+            while True:
+                # Expand the last layer into sorted runs
+                run_paths = []
+                chunk = []
+                for record in _read_records(layer_paths[-1], len(blocks)):
+                    for successor in self.iter_successors(self.decode(record, blocks, len(initial_state))):
+                        chunk.append(self.encode(successor, blocks))
+                    if len(chunk) >= chunk_size:
+                        run_paths.append(self.write_run(workdir, len(run_paths), chunk))
+                        chunk = []
+                if chunk:
+                    run_paths.append(self.write_run(workdir, len(run_paths), chunk))
+
+                next_path = os.path.join(workdir, f"layer-{len(layer_paths)}.bin")
+                written, found = _merge_layer(run_paths, layer_paths[-2:], next_path, len(blocks), goal_record)
+                for path in run_paths:
+                    os.remove(path)
+                if not written:
+                    return None  # No solution found
+                layer_paths.append(next_path)
+
+                if found:
+                    return self.trace_layers(layer_paths, goal_record, blocks, len(initial_state))
+
+    def encode(self, state, blocks):
+        """
+        Encode a state as a fixed-width record: for every block, in sorted
+        order, one byte naming what it rests on (another block's index, or
+        len(blocks) + stack index for the bottom of a stack).
+        """
+        index = {block: i for i, block in enumerate(blocks)}
+        record = bytearray(len(blocks))
+        for stack_index, stack in enumerate(state):
+            below = len(blocks) + stack_index
+            for block in stack:
+                record[index[block]] = below
+                below = index[block]
+        return bytes(record)
+
+    def decode(self, record, blocks, stacks):
+        """Rebuild a state with `stacks` stacks from a record made by encode."""
+        above = {below: block for block, below in enumerate(record)}
+        state = []
+        for stack_index in range(stacks):
+            stack = []
+            support = len(blocks) + stack_index
+            while support in above:
+                support = above[support]
+                stack.append(blocks[support])
+            state.append(tuple(stack))
+        return tuple(state)
+
+    def write_run(self, workdir, number, records):
+        """Write records to a sorted run file and return its path."""
+        path = os.path.join(workdir, f"run-{number}.bin")
+        records.sort()
+        with open(path, "wb") as handle:
+            handle.write(b"".join(records))
+        return path
+
+    def trace_layers(self, layer_paths, goal_record, blocks, stacks):
+        """
+        Rebuild the path of an external BFS by scanning the layers backward.
+        Each earlier layer is streamed until a neighbour of the current state turns up.
+        :return: List of states representing the solution path.
+        """
+        current = goal_record
+        path = [self.decode(current, blocks, stacks)]
+        for layer_path in reversed(layer_paths[:-1]):
+            neighbors = {self.encode(successor, blocks) for successor in self.iter_successors(path[-1])}
+            current = next(record for record in _read_records(layer_path, len(blocks)) if record in neighbors)
+            path.append(self.decode(current, blocks, stacks))
+        path.reverse()
+        return path
+
     def generate_path(self, parent_map, current_state):
         """
         Generate the solution path from the initial state to the goal state.
@@ -84,19 +443,20 @@ class BlockWorld:
         return path
 
 
-# Example: Define initial and goal states
-initial_state = (('A', 'B'), ('C',), ())  # Three stacks: A and B in one, C in another, one empty
-goal_state = (('B',), ('A', 'C'), ())    # Move blocks to achieve goal configuration
+if __name__ == "__main__":
+    # Example: Define initial and goal states
+    initial_state = (('A', 'B'), ('C',), ())  # Three stacks: A and B in one, C in another, one empty
+    goal_state = (('B',), ('A', 'C'), ())    # Move blocks to achieve goal configuration
 
-# Solve the Block World problem
-block_world = BlockWorld(initial_state, goal_state)
-solution_path = block_world.bfs()
+    # Solve the Block World problem
+    block_world = BlockWorld(initial_state, goal_state)
+    solution_path = block_world.bfs()
 
-# Print the solution path
-if solution_path:
-    print("Solution found!")
-    for step in solution_path:
-        print(step)
-else:
-    print("No solution found.")
+    # Print the solution path
+    if solution_path:
+        print("Solution found!")
+        for step in solution_path:
+            print(step)
+    else:
+        print("No solution found.")
 
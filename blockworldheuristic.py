@@ -27,9 +27,120 @@ def calculate_heuristic(start, goal):
     return heuristic
 
 
-# Example usage:
-start_state = [['A'], ['D', 'C', 'B']]  # Example start state
-goal_state = [['D'], ['C', 'B', 'A']]   # Example goal state
+def score_cost(start, goal):
+    """
+    calculate_heuristic turned into a cost: higher scores become lower values,
+    so it can order a best-first search that expands the lowest value first.
+    Not admissible.
+    """
+    return -calculate_heuristic(start, goal)
+
+
+def blocks_out_of_place(start, goal):
+    """
+    Admissible heuristic: count the blocks that must be moved at least once.
+    A block can stay only if it sits at its goal height in its goal stack and
+    every block below it can stay too; any other block is misplaced or rests
+    on a block that has to move from under it.
+
+    :param start: List of lists representing the start state.
+    :param goal: List of lists representing the goal state.
+    :return: Lower bound on the number of moves to reach the goal.
+    """
+    heuristic = 0
+
+    for stack_index, start_stack in enumerate(start):
+        goal_stack = goal[stack_index] if stack_index < len(goal) else ()
+        settled = 0
+        while (settled < len(start_stack) and settled < len(goal_stack)
+               and start_stack[settled] == goal_stack[settled]):
+            settled += 1
+        heuristic += len(start_stack) - settled
+
+    return heuristic
+
+
+class IncrementalHeuristic:
+    """
+    blocks_out_of_place (or score_cost when admissible is False), updated per move in O(1).
+    A move takes the top block off one stack and puts it on another, so only
+    that block's contribution changes. Whether it can stay depends on its goal
+    position, precomputed per block, and on whether the stack below it can
+    stay entirely. The number of blocks that can stay in each stack is
+    carried along with the value, packed into one integer.
+    Pass an instance as heuristic_func; searches that know the move call
+    update instead of rescanning the state.
+    """
+
+    def __init__(self, goal, admissible=True):
+        """
+        :param goal: Tuple of stacks representing the goal state.
+        :param admissible: Count blocks that must move (for A*) instead of the calculate_heuristic score.
+        """
+        self.goal = goal
+        self.admissible = admissible
+        # Block -> (goal stack, goal height)
+        self.goal_position = {block: (stack_index, height)
+                              for stack_index, stack in enumerate(goal) for height, block in enumerate(stack)}
+        self.width = max(1, (len(self.goal_position) + 1).bit_length())  # Bits per stack in the packed counts
+        self.mask = (1 << self.width) - 1
+
+    def __call__(self, start, goal):
+        """Full evaluation, with the same signature as the other heuristics."""
+        return self.evaluate(start)[0]
+
+    def evaluate(self, state):
+        """
+        Score a state from scratch.
+        :return: Tuple (heuristic value, packed per-stack counts of blocks that can stay).
+        """
+        settled = 0
+        for stack_index, stack in enumerate(state):
+            count = 0
+            while count < len(stack) and self.goal_position.get(stack[count]) == (stack_index, count):
+                count += 1
+            settled |= count << (stack_index * self.width)
+        if self.admissible:
+            return blocks_out_of_place(state, self.goal), settled
+        return score_cost(state, self.goal), settled
+
+    def update(self, value, settled, state, source, target):
+        """
+        Score the state reached by moving the top block of stack `source` onto stack `target`.
+        :param value: Heuristic value of `state`.
+        :param settled: Packed counts of `state`, as returned by evaluate or update.
+        :param state: Parent state, before the move.
+        :return: Tuple (heuristic value, packed counts) of the child.
+        """
+        block = state[source][-1]
+        source_height, target_height = len(state[source]) - 1, len(state[target])
+        source_shift, target_shift = source * self.width, target * self.width
+
+        # The top block can stay only if its whole stack can
+        was_settled = (settled >> source_shift) & self.mask == source_height + 1
+        if was_settled:
+            settled -= 1 << source_shift
+        now_settled = ((settled >> target_shift) & self.mask == target_height
+                       and self.goal_position.get(block) == (target, target_height))
+        if now_settled:
+            settled += 1 << target_shift
+
+        if self.admissible:
+            return value + was_settled - now_settled, settled
+        return value + self.contribution(source, source_height, block) \
+            - self.contribution(target, target_height, block), settled
+
+    def contribution(self, stack_index, height, block):
+        """Score calculate_heuristic gives `block` at this height of this stack."""
+        if stack_index >= len(self.goal):
+            return 0
+        return 1 if self.goal_position.get(block) == (stack_index, height) else -1
+
+
+if __name__ == "__main__":
+    # Example usage:
+    start_state = [['A'], ['D', 'C', 'B']]  # Example start state
+    goal_state = [['D'], ['C', 'B', 'A']]   # Example goal state
 
-heuristic_value = calculate_heuristic(start_state, goal_state)
-print(f"Heuristic Value: {heuristic_value}")
+    heuristic_value = calculate_heuristic(start_state, goal_state)
+    print(f"Heuristic Value: {heuristic_value}")
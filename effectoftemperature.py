@@ -1,6 +1,5 @@
 import math
 import random
-import matplotlib.pyplot as plt
 
 
 def simulated_annealing_demo(start_energy, inferior_energy, initial_temp, cooling_rate):
@@ -12,6 +11,8 @@ def simulated_annealing_demo(start_energy, inferior_energy, initial_temp, coolin
     :param initial_temp: Initial temperature for the simulation.
     :param cooling_rate: Cooling rate to reduce the temperature.
     """
+    import matplotlib.pyplot as plt  # Only the plot needs it; the schedules below do not
+
     temperatures = []
     probabilities = []
 
@@ -40,11 +41,63 @@ def simulated_annealing_demo(start_energy, inferior_energy, initial_temp, coolin
     plt.show()
 
 
+def geometric_schedule(initial_temp, cooling_rate):
+    """
+    Cooling used by the demo above: multiply the temperature by cooling_rate.
+    :return: Function (temp, acceptance_rate) -> next temperature.
+    """
+    return lambda temp, acceptance_rate: temp * cooling_rate
+
+
+def linear_schedule(initial_temp, cooling_rate):
+    """
+    Subtract the same amount each step, reaching zero after as many steps as
+    geometric cooling at cooling_rate takes to cool by the demo's factor of 10^4.
+    :return: Function (temp, acceptance_rate) -> next temperature.
+    """
+    decrement = initial_temp * math.log(cooling_rate) / math.log(1e-4)
+    return lambda temp, acceptance_rate: max(temp - decrement, 0.0)
+
+
+def logarithmic_schedule(initial_temp, cooling_rate):
+    """
+    Classic slow cooling T_k = initial_temp / log(k + e); cooling_rate is not used.
+    :return: Function (temp, acceptance_rate) -> next temperature.
+    """
+    step = 0
+
+    def cool(temp, acceptance_rate):
+        nonlocal step
+        step += 1
+        return initial_temp / math.log(step + math.e)
+    return cool
+
+
+def adaptive_schedule(initial_temp, cooling_rate, target_rate=0.3):
+    """
+    Geometric cooling that slows down when too few inferior moves are accepted,
+    so the search spends longer at the temperatures where it still moves.
+    :param target_rate: Acceptance rate above which the full cooling_rate is applied.
+    :return: Function (temp, acceptance_rate) -> next temperature.
+    """
+    slow_rate = math.sqrt(cooling_rate)
+    return lambda temp, acceptance_rate: temp * (cooling_rate if acceptance_rate > target_rate else slow_rate)
+
+
+SCHEDULES = {
+    "geometric": geometric_schedule,
+    "linear": linear_schedule,
+    "logarithmic": logarithmic_schedule,
+    "adaptive": adaptive_schedule,
+}
+
+
 # Parameters
 start_energy = 10  # Energy of the current state
 inferior_energy = 15  # Energy of the inferior state (higher energy)
 initial_temp = 100  # Initial temperature
 cooling_rate = 0.95  # Cooling rate
 
-# Run the simulation
-simulated_annealing_demo(start_energy, inferior_energy, initial_temp, cooling_rate)
+if __name__ == "__main__":
+    # Run the simulation
+    simulated_annealing_demo(start_energy, inferior_energy, initial_temp, cooling_rate)
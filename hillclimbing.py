@@ -1,18 +1,80 @@
+import importlib
+import math
+import multiprocessing
 import random
+import time
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+import effectoftemperature
+
+try:
+    import numpy as np
+except ImportError:  # Batched heuristics are optional; states fall back to heuristic_func
+    np = None
+
+# The parity test lives in 8puzzle.py; its module name is not a valid identifier
+is_solvable = importlib.import_module("8puzzle").is_solvable
+
+def pack_board(board):
+    """
+    Pack a board into a single integer, 4 bits per tile on boards up to 4x4.
+    :param board: 2D tuple representing the puzzle board.
+    :return: Packed board code, usable as a cheap hash key.
+    """
+    bits = max(1, (len(board) * len(board[0]) - 1).bit_length())
+    code = 0
+    for value in reversed([value for row in board for value in row]):
+        code = (code << bits) | value
+    return code
+
+
+def slide_tile(board, blank_pos, tile_pos):
+    """
+    Slide the tile at tile_pos into the blank next to it.
+    Only the rows touched by the move are rebuilt; the rest are shared.
+    :return: New board as a 2D tuple.
+    """
+    (x, y), (nx, ny) = blank_pos, tile_pos
+    new_board = list(board)
+    tile = board[nx][ny]
+    if nx == x:
+        row = list(board[x])
+        row[y], row[ny] = tile, 0
+        new_board[x] = tuple(row)
+    else:
+        blank_row, tile_row = list(board[x]), list(board[nx])
+        blank_row[y], tile_row[ny] = tile, 0
+        new_board[x], new_board[nx] = tuple(blank_row), tuple(tile_row)
+    return tuple(new_board)
+
 
 class PuzzleState:
-    def __init__(self, board, heuristic_func, goal):
+    __slots__ = ("board", "goal", "heuristic_func", "batch_func", "heuristic_value", "blank_pos", "key")
+
+    def __init__(self, board, heuristic_func, goal, blank_pos=None, heuristic_value=None, batch_func=None):
         """
         Initialize a puzzle state.
         :param board: 2D tuple representing the puzzle board.
         :param heuristic_func: Heuristic function to evaluate the state.
         :param goal: Goal state as a 2D tuple.
+        :param blank_pos: Position of the blank tile, if already known.
+        :param heuristic_value: Heuristic value of the board, if already known.
+        :param batch_func: Batched counterpart of heuristic_func; looked up in
+                           BATCH_HEURISTICS when not given. Pass it explicitly
+                           when heuristic_func is a wrapper (e.g. SearchStats.timed).
         """
         self.board = board
         self.goal = goal
         self.heuristic_func = heuristic_func
-        self.heuristic_value = self.heuristic_func(self.board, self.goal)
-        self.blank_pos = self.find_blank()
+        self.batch_func = batch_func if batch_func is not None else _batch_heuristic(heuristic_func)
+        if heuristic_value is None:
+            heuristic_value = self.heuristic_func(self.board, self.goal)
+        self.heuristic_value = heuristic_value
+        self.blank_pos = blank_pos if blank_pos is not None else self.find_blank()
+        self.key = pack_board(board)
 
     def find_blank(self):
         """Find the position of the blank tile (0)."""
@@ -24,24 +86,45 @@ class PuzzleState:
     def possible_moves(self):
         """
         Generate all possible moves by sliding tiles.
+        When the state has a batched heuristic, all neighbors are scored in one call.
         :return: List of new PuzzleState instances after making moves.
         """
+        neighbors = self.neighbor_boards()
+        if self.batch_func is not None:
+            values = self.batch_func([board for board, _ in neighbors], self.goal).tolist()
+        else:
+            values = [None] * len(neighbors)
+        return [PuzzleState(board, self.heuristic_func, self.goal, blank_pos, value, self.batch_func)
+                for (board, blank_pos), value in zip(neighbors, values)]
+
+    def neighbor_boards(self):
+        """
+        Generate the boards reachable by sliding one tile into the blank.
+        Only the rows touched by a move are rebuilt; the rest are shared.
+        :return: List of (board, blank position) pairs.
+        """
         moves = []
+        board = self.board
         x, y = self.blank_pos
         directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
 
         for dx, dy in directions:
             nx, ny = x + dx, y + dy
-            if 0 <= nx < len(self.board) and 0 <= ny < len(self.board[0]):  # Check bounds
-                new_board = [list(row) for row in self.board]
-                new_board[x][y], new_board[nx][ny] = new_board[nx][ny], new_board[x][y]
-                moves.append(PuzzleState(tuple(tuple(row) for row in new_board), self.heuristic_func, self.goal))
+            if 0 <= nx < len(board) and 0 <= ny < len(board[0]):  # Check bounds
+                moves.append((slide_tile(board, (x, y), (nx, ny)), (nx, ny)))
         return moves
 
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
 
 def misplaced_tiles(board, goal):
     """Heuristic: Count the number of misplaced tiles."""
-    return sum(board[i][j] != goal[i][j] and board[i][j] != 0 for i in range(3) for j in range(3))
+    return sum(value != goal_value and value != 0
+               for row, goal_row in zip(board, goal) for value, goal_value in zip(row, goal_row))
 
 
 def manhattan_distance(board, goal):
@@ -55,20 +138,295 @@ def manhattan_distance(board, goal):
     return distance
 
 
-def steepest_ascent_hill_climbing(initial, goal, heuristic_func):
+@lru_cache(maxsize=None)
+def _goal_coordinates(goal):
+    """Arrays of goal rows and goal columns, indexed by tile."""
+    flat = np.asarray(goal).ravel()
+    goal_rows = np.empty(flat.size, dtype=np.intp)
+    goal_cols = np.empty(flat.size, dtype=np.intp)
+    goal_rows[flat] = np.arange(flat.size) // len(goal[0])
+    goal_cols[flat] = np.arange(flat.size) % len(goal[0])
+    return goal_rows, goal_cols
+
+
+def misplaced_tiles_batch(boards, goal):
+    """
+    Heuristic: misplaced tiles of many boards in one vectorized call.
+    :param boards: Array-like of shape (N, rows, cols).
+    :param goal: Goal state as a 2D tuple.
+    :return: NumPy array of N tile counts.
+    """
+    boards = np.asarray(boards)
+    misplaced = (boards != np.asarray(goal)) & (boards != 0)
+    return misplaced.reshape(len(boards), -1).sum(axis=1)
+
+
+def manhattan_distance_batch(boards, goal):
+    """
+    Heuristic: Manhattan distance of many boards in one vectorized call.
+    :param boards: Array-like of shape (N, rows, cols).
+    :param goal: Goal state as a 2D tuple.
+    :return: NumPy array of N distances.
+    """
+    boards = np.asarray(boards)
+    count, rows, cols = boards.shape
+    goal_rows, goal_cols = _goal_coordinates(goal)
+    distance = (np.abs(goal_rows[boards] - np.arange(rows)[:, None])
+                + np.abs(goal_cols[boards] - np.arange(cols)))
+    distance[boards == 0] = 0  # Skip the blank tile
+    return distance.reshape(count, -1).sum(axis=1)
+
+
+# Scalar heuristic -> vectorized version used to score whole neighbor lists
+BATCH_HEURISTICS = {
+    misplaced_tiles: misplaced_tiles_batch,
+    manhattan_distance: manhattan_distance_batch,
+}
+
+
+def _batch_heuristic(heuristic_func):
+    """Batched counterpart of a scalar heuristic, or None without NumPy or a batched version."""
+    return BATCH_HEURISTICS.get(heuristic_func) if np is not None else None
+
+
+@lru_cache(maxsize=None)
+def _goal_positions(goal):
+    """Goal (row, col) of every tile."""
+    return {value: (x, y) for x, row in enumerate(goal) for y, value in enumerate(row)}
+
+
+def misplaced_tiles_delta(tile, source, target, goal):
+    """Change in misplaced_tiles when `tile` slides from source to target."""
+    return (goal[target[0]][target[1]] != tile) - (goal[source[0]][source[1]] != tile)
+
+
+def manhattan_distance_delta(tile, source, target, goal):
+    """Change in manhattan_distance when `tile` slides from source to target."""
+    goal_x, goal_y = _goal_positions(goal)[tile]
+    return (abs(target[0] - goal_x) + abs(target[1] - goal_y)
+            - abs(source[0] - goal_x) - abs(source[1] - goal_y))
+
+
+# Scalar heuristic -> O(1) update for a single slide, used by simulated_annealing
+DELTA_HEURISTICS = {
+    misplaced_tiles: misplaced_tiles_delta,
+    manhattan_distance: manhattan_distance_delta,
+}
+
+
+class _LineTable(dict):
+    """Dictionary that scores a board line on its first lookup and keeps the result."""
+
+    def __init__(self, score):
+        super().__init__()
+        self.score = score
+
+    def __missing__(self, line):
+        value = self[line] = self.score(line)
+        return value
+
+
+def _longest_increasing(values):
+    """Length of the longest strictly increasing subsequence of `values`."""
+    tails = []
+    for value in values:
+        index = bisect_left(tails, value)
+        if index == len(tails):
+            tails.append(value)
+        else:
+            tails[index] = value
+    return len(tails)
+
+
+@lru_cache(maxsize=None)
+def _linear_conflict_tables(goal):
+    """
+    Per-row and per-column tables for linear_conflict, filled lazily.
+    A row entry is the horizontal Manhattan distance of the row's tiles plus
+    two moves for every tile that must leave the row so the tiles belonging
+    to it can pass each other (row length minus the longest increasing run of
+    goal columns). Column entries are the vertical counterpart.
+    """
+    positions = {value: (x, y) for x, row in enumerate(goal) for y, value in enumerate(row)}
+
+    def line_score(index, axis):
+        def score(line):
+            distance = 0
+            goal_offsets = []
+            for offset, value in enumerate(line):
+                if value == 0:  # Skip the blank tile
+                    continue
+                goal_line, goal_offset = positions[value] if axis == 0 else positions[value][::-1]
+                distance += abs(offset - goal_offset)
+                if goal_line == index:
+                    goal_offsets.append(goal_offset)
+            return distance + 2 * (len(goal_offsets) - _longest_increasing(goal_offsets))
+        return score
+
+    row_tables = [_LineTable(line_score(i, 0)) for i in range(len(goal))]
+    column_tables = [_LineTable(line_score(j, 1)) for j in range(len(goal[0]))]
+    return row_tables, column_tables
+
+
+def linear_conflict(board, goal):
+    """Heuristic: Manhattan distance plus linear conflicts, as one table lookup per row and column."""
+    row_tables, column_tables = _linear_conflict_tables(goal)
+    return (sum(table[row] for table, row in zip(row_tables, board))
+            + sum(table[column] for table, column in zip(column_tables, zip(*board))))
+
+
+@lru_cache(maxsize=None)
+def _walking_distance_tables(goal):
+    """
+    Tables for one axis of walking_distance.
+    A board is abstracted line by line into how many of its tiles belong to
+    each goal line, plus a flag for the line holding the blank. A BFS from
+    the goal over these abstract boards, where the blank trades places with
+    a tile from a neighbouring line, gives the exact number of moves along
+    this axis.
+    :param goal: Goal state as a 2D tuple (transpose it for the other axis).
+    :return: Tuple (line table mapping a line to its counts, distance dictionary).
+    """
+    lines = len(goal)
+    goal_line = {value: x for x, row in enumerate(goal) for value in row}
+
+    def counts(line):
+        tally = [0] * (lines + 1)
+        for value in line:
+            if value == 0:
+                tally[lines] = 1  # Blank flag
+            else:
+                tally[goal_line[value]] += 1
+        return tuple(tally)
+
+    line_counts = _LineTable(counts)
+    start = tuple(counts(row) for row in goal)
+    distances = {start: 0}
+    queue = deque([start])
+
+    while queue:
+        state = queue.popleft()
+        blank = next(x for x, line in enumerate(state) if line[lines])
+        for neighbor in (blank - 1, blank + 1):
+            if not 0 <= neighbor < lines:
+                continue
+            for target in range(lines):
+                if not state[neighbor][target]:
+                    continue
+                # A tile bound for `target` moves into the blank's line
+                blank_line, tile_line = list(state[blank]), list(state[neighbor])
+                blank_line[target] += 1
+                blank_line[lines] = 0
+                tile_line[target] -= 1
+                tile_line[lines] = 1
+                child = list(state)
+                child[blank], child[neighbor] = tuple(blank_line), tuple(tile_line)
+                child = tuple(child)
+                if child not in distances:
+                    distances[child] = distances[state] + 1
+                    queue.append(child)
+
+    return line_counts, distances
+
+
+def walking_distance(board, goal):
+    """Heuristic: vertical plus horizontal walking distance, from precomputed tables."""
+    row_counts, vertical = _walking_distance_tables(goal)
+    column_counts, horizontal = _walking_distance_tables(tuple(zip(*goal)))
+    return (vertical[tuple(map(row_counts.__getitem__, board))]
+            + horizontal[tuple(map(column_counts.__getitem__, zip(*board)))])
+
+
+class HeuristicCache:
+    """
+    Bounded LRU cache of heuristic values, keyed by packed board.
+    An instance is called like the heuristic it wraps, so it can be passed as
+    heuristic_func to any solver here; passing the same instance to several
+    climbs lets them share values for boards they have in common.
     """
-    Solve the 8-puzzle problem using steepest ascent hill climbing.
+
+    def __init__(self, heuristic_func, maxsize=100000):
+        """
+        :param heuristic_func: Heuristic function to cache, called as heuristic_func(board, goal).
+        :param maxsize: Maximum number of cached values; the least recently used is evicted first.
+        """
+        self.heuristic_func = heuristic_func
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __call__(self, board, goal):
+        key = (pack_board(board), goal)
+        entries = self.entries
+        value = entries.get(key)
+        if value is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return value
+
+        self.misses += 1
+        value = entries[key] = self.heuristic_func(board, goal)
+        if len(entries) > self.maxsize:
+            entries.popitem(last=False)
+            self.evictions += 1
+        return value
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def counters(self):
+        """Return hits, misses and evictions as a dictionary."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def report(self):
+        """Return the counters, current size and hit rate as a dictionary."""
+        return dict(self.counters(), size=len(self.entries), maxsize=self.maxsize, hit_rate=self.hit_rate)
+
+    def clear(self):
+        """Drop all cached values and reset the counters."""
+        self.entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.report().items())
+        return f"HeuristicCache({fields})"
+
+
+def steepest_ascent_hill_climbing(initial, goal, heuristic_func, stats=None):
+    """
+    Solve the sliding puzzle (any rows x cols board) using steepest ascent hill climbing.
     :param initial: Initial state as a 2D tuple.
     :param goal: Goal state as a 2D tuple.
     :param heuristic_func: Heuristic function to evaluate states.
+    :param stats: Optional SearchStats updated during the climb.
     :return: Solution path and success status.
     """
-    current_state = PuzzleState(initial, heuristic_func, goal)
+    batch_func = _batch_heuristic(heuristic_func)  # Looked up before timing wraps heuristic_func
+    if stats is not None:
+        stats.start()
+        heuristic_func = stats.timed(heuristic_func)
+        if batch_func is not None:
+            batch_func = stats.timed(batch_func)
+
+    if not is_solvable(initial, goal):
+        if stats is not None:
+            stats.stop(None)
+        return [initial], False  # Unreachable goal: don't climb at all
+
+    current_state = PuzzleState(initial, heuristic_func, goal, batch_func=batch_func)
     path = [current_state.board]
 
     while True:
         neighbors = current_state.possible_moves()
         best_neighbor = min(neighbors, key=lambda state: state.heuristic_value)
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += len(neighbors)
+            stats.observe(len(neighbors), len(path))
 
         # If no improvement, terminate
         if best_neighbor.heuristic_value >= current_state.heuristic_value:
@@ -80,35 +438,432 @@ def steepest_ascent_hill_climbing(initial, goal, heuristic_func):
 
         # Check if goal is reached
         if current_state.heuristic_value == 0:
+            if stats is not None:
+                stats.stop(path)
             return path, True
 
+    if stats is not None:
+        stats.stop(None)
     return path, False
 
 
-# Example: Define initial and goal states
-initial_state = (
-    (1, 2, 3),
-    (4, 0, 5),
-    (7, 8, 6)
-)
+def _extend_path(path, index, board):
+    """
+    Append a board to a local-search path, cutting out the loop if the board is already on it.
+    :param path: List of boards from the initial board.
+    :param index: Dictionary mapping each board on the path to its position.
+    """
+    if board in index:  # Back on an earlier board: drop the loop
+        for removed in path[index[board] + 1:]:
+            del index[removed]
+        del path[index[board] + 1:]
+    else:
+        index[board] = len(path)
+        path.append(board)
+
+
+def simulated_annealing(initial, goal, heuristic_func, initial_temp=effectoftemperature.initial_temp,
+                        cooling_rate=effectoftemperature.cooling_rate,
+                        schedule=effectoftemperature.geometric_schedule, steps_per_temp=100, min_temp=0.01,
+                        max_steps=200000, seed=0, stats=None):
+    """
+    Solve the sliding puzzle using simulated annealing.
+    Each step samples one slide and scores only that child; heuristics in
+    DELTA_HEURISTICS are updated from the moved tile alone. An inferior move
+    is accepted with probability exp(-delta / temp), as in effectoftemperature.py.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param heuristic_func: Heuristic function to evaluate states.
+    :param initial_temp: Starting temperature.
+    :param cooling_rate: Cooling rate passed to the schedule.
+    :param schedule: Schedule factory from effectoftemperature.SCHEDULES.
+    :param steps_per_temp: Moves tried at each temperature before cooling.
+    :param min_temp: Temperature at which the search stops.
+    :param max_steps: Upper bound on moves tried, for slow schedules.
+    :param seed: Seed of the random generator.
+    :param stats: Optional SearchStats updated during the search.
+    :return: Solution path (with loops cut out) and success status.
+    """
+    delta_func = DELTA_HEURISTICS.get(heuristic_func)  # Looked up before timing wraps heuristic_func
+    if stats is not None:
+        stats.start()
+        heuristic_func = stats.timed(heuristic_func)
+        if delta_func is not None:
+            delta_func = stats.timed(delta_func)
+
+    if not is_solvable(initial, goal):
+        if stats is not None:
+            stats.stop(None)
+        return [initial], False  # Unreachable goal: don't anneal at all
+
+    rng = random.Random(seed)
+    cool = schedule(initial_temp, cooling_rate)
+    rows, cols = len(initial), len(initial[0])
+    directions = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Up, Down, Left, Right
+
+    board = initial
+    blank_pos = PuzzleState(initial, heuristic_func, goal, heuristic_value=0).blank_pos
+    heuristic_value = heuristic_func(board, goal)
+    path = [board]
+    index = {board: 0}  # Board -> position in path, to cut loops
+    temp = initial_temp
+    steps = 0
+
+    while heuristic_value and temp > min_temp and steps < max_steps:
+        inferior = accepted = 0
+        for _ in range(steps_per_temp):
+            steps += 1
+            x, y = blank_pos
+            nx, ny = rng.choice([(x + dx, y + dy) for dx, dy in directions
+                                 if 0 <= x + dx < rows and 0 <= y + dy < cols])
+            tile = board[nx][ny]
+            child = slide_tile(board, blank_pos, (nx, ny))
+            if delta_func is not None:
+                delta = delta_func(tile, (nx, ny), blank_pos, goal)
+            else:
+                delta = heuristic_func(child, goal) - heuristic_value
+            if stats is not None:
+                stats.expanded += 1
+                stats.generated += 1
+
+            if delta > 0:
+                inferior += 1
+                if rng.random() >= math.exp(-delta / temp):
+                    continue  # Rejected
+                accepted += 1
+
+            board, blank_pos, heuristic_value = child, (nx, ny), heuristic_value + delta
+            _extend_path(path, index, board)
+            if stats is not None:
+                stats.observe(1, len(path))
+            if heuristic_value == 0 or steps >= max_steps:
+                break
+
+        temp = cool(temp, accepted / inferior if inferior else 1.0)
+
+    success = heuristic_value == 0
+    if stats is not None:
+        stats.stop(path if success else None)
+    return path, success
+
+
+class TabuList:
+    """
+    Fixed-size tabu memory of packed board keys.
+    Keys live in a ring buffer, so adding one overwrites the oldest, and a
+    count per key gives O(1) membership even when a key is in the buffer twice.
+    """
+
+    __slots__ = ("ring", "counts", "cursor")
+
+    def __init__(self, tenure):
+        """
+        :param tenure: Number of most recent keys that stay tabu.
+        """
+        self.ring = [None] * tenure
+        self.counts = {}
+        self.cursor = 0
+
+    def add(self, key):
+        """Make a key tabu, forgetting the oldest one."""
+        if not self.ring:
+            return
+        old = self.ring[self.cursor]
+        if old is not None:
+            if self.counts[old] == 1:
+                del self.counts[old]
+            else:
+                self.counts[old] -= 1
+        self.ring[self.cursor] = key
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.cursor = (self.cursor + 1) % len(self.ring)
+
+    def __contains__(self, key):
+        return key in self.counts
+
+    def __len__(self):
+        return len(self.counts)
+
+
+def tabu_search(initial, goal, heuristic_func, tenure=32, max_steps=10000, stats=None):
+    """
+    Solve the sliding puzzle using tabu search.
+    Like steepest ascent, every step moves to the best neighbor, but sideways
+    and worsening moves are allowed and the last `tenure` boards are tabu so
+    the search walks off plateaus instead of stopping or cycling. A tabu
+    neighbor is still taken if it beats the best heuristic value seen so far
+    (aspiration).
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param heuristic_func: Heuristic function to evaluate states.
+    :param tenure: Size of the tabu list.
+    :param max_steps: Maximum number of moves.
+    :param stats: Optional SearchStats updated during the search.
+    :return: Solution path (with loops cut out) and success status.
+    """
+    batch_func = _batch_heuristic(heuristic_func)  # Looked up before timing wraps heuristic_func
+    if stats is not None:
+        stats.start()
+        heuristic_func = stats.timed(heuristic_func)
+        if batch_func is not None:
+            batch_func = stats.timed(batch_func)
+
+    if not is_solvable(initial, goal):
+        if stats is not None:
+            stats.stop(None)
+        return [initial], False  # Unreachable goal: don't search at all
+
+    current_state = PuzzleState(initial, heuristic_func, goal, batch_func=batch_func)
+    path = [current_state.board]
+    index = {current_state.board: 0}  # Board -> position in path, to cut loops
+    tabu = TabuList(tenure)
+    tabu.add(current_state.key)
+    best_value = current_state.heuristic_value
+
+    for _ in range(max_steps):
+        if current_state.heuristic_value == 0:
+            break
+        neighbors = current_state.possible_moves()
+        allowed = [state for state in neighbors if state.key not in tabu or state.heuristic_value < best_value]
+        if stats is not None:
+            stats.expanded += 1
+            stats.generated += len(neighbors)
+            stats.duplicates += len(neighbors) - len(allowed)
+            stats.observe(len(neighbors), len(path))
+        if not allowed:
+            break  # Every neighbor is tabu
+
+        current_state = min(allowed, key=lambda state: state.heuristic_value)
+        tabu.add(current_state.key)
+        best_value = min(best_value, current_state.heuristic_value)
+        _extend_path(path, index, current_state.board)
+
+    success = current_state.heuristic_value == 0
+    if stats is not None:
+        stats.stop(path if success else None)
+    return path, success
+
+
+def local_beam_search(initial, goal, heuristic_func, k=8, max_rounds=1000, stats=None):
+    """
+    Solve the sliding puzzle using local beam search.
+    The k best states are kept and all of them are expanded each round. The
+    children are deduplicated by packed key (boards in the current beam are
+    skipped too, so the beam cannot fall straight back) and scored in one
+    batched heuristic call when NumPy and a batched heuristic are available.
+    Each round costs at most 4k heuristic evaluations and holds at most 4k boards.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param heuristic_func: Heuristic function to evaluate states.
+    :param k: Beam width.
+    :param max_rounds: Maximum number of rounds.
+    :param stats: Optional SearchStats updated during the search.
+    :return: Solution path and success status.
+    """
+    batch_func = _batch_heuristic(heuristic_func)  # Looked up before timing wraps heuristic_func
+    if stats is not None:
+        stats.start()
+        heuristic_func = stats.timed(heuristic_func)
+        if batch_func is not None:
+            batch_func = stats.timed(batch_func)
+
+    if not is_solvable(initial, goal):
+        if stats is not None:
+            stats.stop(None)
+        return [initial], False  # Unreachable goal: don't search at all
+
+    start = PuzzleState(initial, heuristic_func, goal, batch_func=batch_func)
+    beam = [(start, (initial, None))]  # (state, linked path node (board, parent node))
+    best_state, best_node = beam[0]
+
+    for _ in range(max_rounds):
+        if best_state.heuristic_value == 0:
+            break
+        seen = {state.key for state, _ in beam}
+        children = []
+        generated = 0
+        for state, node in beam:
+            for board, blank_pos in state.neighbor_boards():
+                generated += 1
+                key = pack_board(board)
+                if key not in seen:
+                    seen.add(key)
+                    children.append((board, blank_pos, node))
+        if stats is not None:
+            stats.expanded += len(beam)
+            stats.generated += generated
+            stats.duplicates += generated - len(children)
+            stats.observe(len(children), len(beam))
+        if not children:
+            break
+
+        if batch_func is not None:
+            values = batch_func([board for board, _, _ in children], goal).tolist()
+        else:
+            values = [heuristic_func(board, goal) for board, _, _ in children]
+        ranked = sorted(range(len(children)), key=values.__getitem__)[:k]
+        beam = [(PuzzleState(children[i][0], heuristic_func, goal, children[i][1], values[i], batch_func),
+                 (children[i][0], children[i][2])) for i in ranked]
+        if beam[0][0].heuristic_value < best_state.heuristic_value:
+            best_state, best_node = beam[0]
+
+    path = []
+    while best_node is not None:
+        best_node, board = best_node[1], best_node[0]
+        path.append(board)
+    path.reverse()
+    success = best_state.heuristic_value == 0
+    if stats is not None:
+        stats.stop(path if success else None)
+    return path, success
+
+
+def random_walk(initial, goal, heuristic_func, length, rng):
+    """
+    Scramble a board with random slides, never undoing the previous one.
+    :param rng: random.Random instance driving the walk.
+    :return: List of boards visited, starting with `initial`.
+    """
+    state = PuzzleState(initial, heuristic_func, goal, heuristic_value=0)  # Heuristic unused here
+    walk = [initial]
+    for _ in range(length):
+        options = [(board, blank_pos) for board, blank_pos in state.neighbor_boards()
+                   if len(walk) < 2 or board != walk[-2]]
+        board, blank_pos = rng.choice(options)
+        state = PuzzleState(board, heuristic_func, goal, blank_pos, heuristic_value=0)
+        walk.append(board)
+    return walk
+
+
+_stop_event = None  # Set in each restart worker by _init_restart_worker
+_worker_heuristic = None
+
+
+def _init_restart_worker(stop_event, heuristic_func):
+    """
+    Share the early-stop flag with a worker process.
+    The heuristic is sent once here rather than with every batch, so a
+    HeuristicCache stays warm across all the climbs a worker runs.
+    """
+    global _stop_event, _worker_heuristic
+    _stop_event = stop_event
+    _worker_heuristic = heuristic_func
+
+
+def _climb_batch(initial, goal, climbs, walk_length):
+    """
+    Run seeded climbs in a worker until one succeeds or another worker has.
+    Climb 0 starts from `initial` itself; the others first take a random walk of walk_length slides.
+    :param climbs: List of (climb index, seed) pairs.
+    :return: Tuple (list of (index, success, path) for the climbs that ran,
+             cache counters gained during the batch or None).
+    """
+    heuristic_func = _worker_heuristic
+    caching = isinstance(heuristic_func, HeuristicCache)
+    before = heuristic_func.counters() if caching else None
+    results = []
+    for index, seed in climbs:
+        if _stop_event.is_set():
+            break
+        rng = random.Random(seed)
+        walk = random_walk(initial, goal, heuristic_func, walk_length if index else 0, rng)
+        path, success = steepest_ascent_hill_climbing(walk[-1], goal, heuristic_func)
+        results.append((index, success, walk[:-1] + path if success else None))
+        if success:
+            _stop_event.set()
+            break
+    if caching:
+        return results, {key: value - before[key] for key, value in heuristic_func.counters().items()}
+    return results, None
+
+
+def random_restart_hill_climbing(initial, goal, heuristic_func, restarts=100, walk_length=20, seed=0,
+                                 max_workers=None, batch_size=4):
+    """
+    Random-restart hill climbing on a process pool.
+    Each climb starts from the initial board scrambled by a seeded random walk,
+    so every returned path really starts at `initial`. Once any worker
+    reaches h == 0 the others stop after their current climb.
+    :param initial: Initial state as a 2D tuple.
+    :param goal: Goal state as a 2D tuple.
+    :param heuristic_func: Heuristic function to evaluate states (must be picklable).
+                           A HeuristicCache is copied into each worker and
+                           shared by all the climbs that worker runs.
+    :param restarts: Maximum number of climbs.
+    :param walk_length: Number of random slides before each restarted climb.
+    :param seed: Base seed; climb i uses seed * restarts + i.
+    :param max_workers: Number of worker processes; defaults to the CPU count.
+    :param batch_size: Climbs sent to a worker per task.
+    :return: Tuple (solution path or None, report) where the report holds the
+             number of climbs run, successes, success rate, time to first
+             solution and total time, plus summed cache counters when
+             heuristic_func is a HeuristicCache.
+    """
+    started = time.perf_counter()
+    report = {"climbs": 0, "successes": 0, "success_rate": 0.0, "time_to_first_solution": None, "seconds": 0.0}
+    if not is_solvable(initial, goal):
+        return None, report  # Unreachable goal: don't climb at all
+
+    climbs = [(i, seed * restarts + i) for i in range(restarts)]
+    batches = [climbs[i:i + batch_size] for i in range(0, restarts, batch_size)]
+    stop_event = multiprocessing.Event()
+    cache = {"hits": 0, "misses": 0, "evictions": 0} if isinstance(heuristic_func, HeuristicCache) else None
+    solution = None
+
+    with ProcessPoolExecutor(max_workers, initializer=_init_restart_worker,
+                             initargs=(stop_event, heuristic_func)) as executor:
+        futures = [executor.submit(_climb_batch, initial, goal, batch, walk_length) for batch in batches]
+        for future in as_completed(futures):
+            results, counters = future.result()
+            if counters is not None:
+                for key, value in counters.items():
+                    cache[key] += value
+            for _, success, path in results:
+                report["climbs"] += 1
+                if success:
+                    report["successes"] += 1
+                    if solution is None:
+                        solution = path
+                        report["time_to_first_solution"] = time.perf_counter() - started
+            if solution is not None:
+                stop_event.set()
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    report["success_rate"] = report["successes"] / report["climbs"] if report["climbs"] else 0.0
+    report["seconds"] = time.perf_counter() - started
+    if cache is not None:
+        lookups = cache["hits"] + cache["misses"]
+        report["cache"] = dict(cache, hit_rate=cache["hits"] / lookups if lookups else 0.0)
+    return solution, report
+
+
+if __name__ == "__main__":
+    # Example: Define initial and goal states
+    initial_state = (
+        (1, 2, 3),
+        (4, 0, 5),
+        (7, 8, 6)
+    )
 
-goal_state = (
-    (1, 2, 3),
-    (4, 5, 6),
-    (7, 8, 0)
-)
+    goal_state = (
+        (1, 2, 3),
+        (4, 5, 6),
+        (7, 8, 0)
+    )
 
-# Solve the puzzle using both heuristics
-path, success = steepest_ascent_hill_climbing(initial_state, goal_state, manhattan_distance)
+    # Solve the puzzle using both heuristics
+    path, success = steepest_ascent_hill_climbing(initial_state, goal_state, manhattan_distance)
 
-# Print the result
-if success:
-    print("Solution found! Steps:")
-    for step in path:
-        for row in step:
+    # Print the result
+    if success:
+        print("Solution found! Steps:")
+        for step in path:
+            for row in step:
+                print(row)
+            print()
+    else:
+        print("No solution found. Final state:")
+        for row in path[-1]:
             print(row)
-        print()
-else:
-    print("No solution found. Final state:")
-    for row in path[-1]:
-        print(row)
@@ -0,0 +1,92 @@
+import time
+
+
+class SearchStats:
+    """
+    Counters a solver updates while it searches.
+    Pass an instance as a solver's `stats` argument. Solvers skip all of this
+    bookkeeping when `stats` is None, so an uninstrumented run pays only for
+    the None checks.
+    """
+
+    def __init__(self):
+        self.generated = 0  # Successor states created
+        self.expanded = 0  # States whose successors were generated
+        self.duplicates = 0  # Successors or queued entries discarded as already seen
+        self.peak_open = 0  # Largest frontier size observed
+        self.peak_closed = 0  # Largest visited-set size observed
+        self.heuristic_time = 0.0  # Seconds spent inside timed heuristic calls
+        self.wall_time = 0.0  # Seconds between start() and stop()
+        self.solution_length = None  # Moves in the returned path, if any
+        self._started = None
+
+    def start(self):
+        """Mark the beginning of a search."""
+        self._started = time.perf_counter()
+
+    def stop(self, path=None):
+        """
+        Mark the end of a search.
+        :param path: Path returned by the solver, or None if it failed.
+        """
+        self.wall_time = time.perf_counter() - self._started
+        self.solution_length = len(path) - 1 if path else None
+
+    def observe(self, open_size, closed_size):
+        """Record the current frontier and visited-set sizes."""
+        if open_size > self.peak_open:
+            self.peak_open = open_size
+        if closed_size > self.peak_closed:
+            self.peak_closed = closed_size
+
+    def timed(self, heuristic_func):
+        """
+        Wrap a heuristic so the time spent in it is added to heuristic_time.
+        :param heuristic_func: Heuristic called as heuristic_func(board, goal), or
+                               any other function whose time should count as heuristic time.
+        :return: Wrapped heuristic with the same signature.
+        """
+        def timed_heuristic(*args):
+            started = time.perf_counter()
+            value = heuristic_func(*args)
+            self.heuristic_time += time.perf_counter() - started
+            return value
+        return timed_heuristic
+
+    @property
+    def effective_branching_factor(self):
+        """
+        Branching factor b* of a uniform tree of the solution's depth d holding
+        as many nodes as were generated: N + 1 = 1 + b* + b*^2 + ... + b*^d.
+        """
+        depth = self.solution_length
+        if not depth or not self.generated:
+            return None
+        target = self.generated + 1
+        low, high = 0.0, max(1.0, target ** (1 / depth))  # b*^d <= N + 1, so this bounds b* without overflow
+        for _ in range(100):  # Bisection; the node count grows with b
+            middle = (low + high) / 2
+            if sum(middle ** i for i in range(depth + 1)) < target:
+                low = middle
+            else:
+                high = middle
+        return high
+
+    def as_dict(self):
+        """Return the counters, including derived rates, as a dictionary."""
+        return {
+            "generated": self.generated,
+            "expanded": self.expanded,
+            "duplicates": self.duplicates,
+            "peak_open": self.peak_open,
+            "peak_closed": self.peak_closed,
+            "heuristic_time": self.heuristic_time,
+            "wall_time": self.wall_time,
+            "solution_length": self.solution_length,
+            "effective_branching_factor": self.effective_branching_factor,
+            "nodes_per_second": self.generated / self.wall_time if self.wall_time else None,
+        }
+
+    def __repr__(self):
+        fields = ", ".join(f"{key}={value!r}" for key, value in self.as_dict().items())
+        return f"SearchStats({fields})"
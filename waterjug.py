@@ -1,9 +1,10 @@
 from collections import deque
 
 class WaterJug:
-    def __init__(self, initial_state, goal_state):
+    def __init__(self, initial_state, goal_state, capacities=(4, 3)):
         self.initial_state = initial_state
         self.goal_state = goal_state
+        self.capacities = capacities  # Sizes of jug1 and jug2 in liters
 
     def goalTest(self, current_state):
         """Check if the current state is the goal state."""
@@ -13,14 +14,15 @@ class WaterJug:
         """Generate all possible successor states."""
         successors = []
         jug1, jug2 = state
+        capacity1, capacity2 = self.capacities
 
         # Production rules
-        # Fill jug1 (4L jug)
-        if jug1 < 4:
-            successors.append((4, jug2))
-        # Fill jug2 (3L jug)
-        if jug2 < 3:
-            successors.append((jug1, 3))
+        # Fill jug1 (4L jug by default)
+        if jug1 < capacity1:
+            successors.append((capacity1, jug2))
+        # Fill jug2 (3L jug by default)
+        if jug2 < capacity2:
+            successors.append((jug1, capacity2))
         # Empty jug1
         if jug1 > 0:
             successors.append((0, jug2))
@@ -28,18 +30,44 @@ class WaterJug:
         if jug2 > 0:
             successors.append((jug1, 0))
         # Pour water from jug1 to jug2
-        if jug1 > 0 and jug2 < 3:
-            transfer = min(jug1, 3 - jug2)
+        if jug1 > 0 and jug2 < capacity2:
+            transfer = min(jug1, capacity2 - jug2)
             successors.append((jug1 - transfer, jug2 + transfer))
         # Pour water from jug2 to jug1
-        if jug2 > 0 and jug1 < 4:
-            transfer = min(jug2, 4 - jug1)
+        if jug2 > 0 and jug1 < capacity1:
+            transfer = min(jug2, capacity1 - jug1)
             successors.append((jug1 + transfer, jug2 - transfer))
 
         return successors
 
-    def bfs(self):
-        """Breadth-First Search algorithm to find the solution."""
+    def predecessor(self, state):
+        """Generate all states from which one production rule reaches `state`."""
+        jug1, jug2 = state
+        capacity1, capacity2 = self.capacities
+        candidates = set()
+
+        # Filling or emptying a jug could have started from any level of that jug
+        if jug1 in (0, capacity1):
+            candidates.update((level, jug2) for level in range(capacity1 + 1))
+        if jug2 in (0, capacity2):
+            candidates.update((jug1, level) for level in range(capacity2 + 1))
+        # Pouring moved some amount between the jugs
+        for transfer in range(1, min(capacity1, capacity2) + 1):
+            candidates.add((jug1 + transfer, jug2 - transfer))
+            candidates.add((jug1 - transfer, jug2 + transfer))
+
+        return [candidate for candidate in candidates
+                if 0 <= candidate[0] <= capacity1 and 0 <= candidate[1] <= capacity2
+                and state in self.successor(candidate)]
+
+    def bfs(self, stats=None):
+        """
+        Breadth-First Search algorithm to find the solution.
+        :param stats: Optional SearchStats updated during the search.
+        """
+        if stats is not None:
+            stats.start()
+
         open_list = deque()  # Queue for BFS
         closed_list = set()  # Visited states
         parent_map = {}  # Track parent of each state
@@ -54,17 +82,76 @@ class WaterJug:
 
             # Check if goal state is reached
             if self.goalTest(current_state):
-                return self.generate_path(parent_map, current_state)
+                path = self.generate_path(parent_map, current_state)
+                if stats is not None:
+                    stats.stop(path)
+                return path
 
             # Explore successors
-            for successor in self.successor(current_state):
+            successors = self.successor(current_state)
+            for successor in successors:
                 if successor not in closed_list:
                     open_list.append(successor)
                     closed_list.add(successor)
                     parent_map[successor] = current_state
+                elif stats is not None:
+                    stats.duplicates += 1
 
+            if stats is not None:
+                stats.expanded += 1
+                stats.generated += len(successors)
+                stats.observe(len(open_list), len(closed_list))
+
+        if stats is not None:
+            stats.stop(None)
         return None  # No solution found
 
+    def bidirectional_search(self):
+        """
+        Bidirectional BFS: grow one frontier forward from the initial state with
+        successor and one backward from the goal state with predecessor, a full
+        layer at a time, until they meet.
+        """
+        if self.goalTest(self.initial_state):
+            return [self.initial_state]
+
+        forward_parents = {self.initial_state: None}  # Parent of each state reached from the start
+        backward_parents = {self.goal_state: None}  # Next state toward the goal
+        forward_frontier = [self.initial_state]
+        backward_frontier = [self.goal_state]
+
+        while forward_frontier and backward_frontier:
+            # Expand the smaller frontier by one full layer
+            grow_forward = len(forward_frontier) <= len(backward_frontier)
+            if grow_forward:
+                frontier, parent_map, other_map, expand = (forward_frontier, forward_parents,
+                                                           backward_parents, self.successor)
+            else:
+                frontier, parent_map, other_map, expand = (backward_frontier, backward_parents,
+                                                           forward_parents, self.predecessor)
+
+            next_frontier = []
+            for current_state in frontier:
+                for neighbor in expand(current_state):
+                    if neighbor not in parent_map:
+                        parent_map[neighbor] = current_state
+                        next_frontier.append(neighbor)
+                        if neighbor in other_map:  # Frontiers met
+                            return self.join_paths(forward_parents, backward_parents, neighbor)
+
+            if grow_forward:
+                forward_frontier = next_frontier
+            else:
+                backward_frontier = next_frontier
+
+        return None  # No solution found
+
+    def join_paths(self, forward_parents, backward_parents, meeting_state):
+        """Join the forward and backward halves of the path at the state where they met."""
+        forward_path = self.generate_path(forward_parents, meeting_state)
+        backward_path = self.generate_path(backward_parents, meeting_state)
+        return forward_path + backward_path[-2::-1]
+
     def generate_path(self, parent_map, current_state):
         """Generate the solution path from the initial state to the goal state."""
         path = []
@@ -75,21 +162,22 @@ class WaterJug:
         return path
 
 
-# Instantiate the WaterJug class
-initial_state = (4, 0)  # 4-liter jug full, 3-liter jug empty
-goal_state = (2, 0)     # Goal: 2 liters in 4-liter jug
+if __name__ == "__main__":
+    # Instantiate the WaterJug class
+    initial_state = (4, 0)  # 4-liter jug full, 3-liter jug empty
+    goal_state = (2, 0)     # Goal: 2 liters in 4-liter jug
 
-water_jug_problem = WaterJug(initial_state, goal_state)
+    water_jug_problem = WaterJug(initial_state, goal_state)
 
-# Solve the problem using BFS
-solution_path = water_jug_problem.bfs()
+    # Solve the problem using BFS
+    solution_path = water_jug_problem.bfs()
 
-# Print the solution path
-if solution_path:
-    print("Solution found!")
-    for step in solution_path:
-        print(step)
-else:
-    print("No solution found.")
+    # Print the solution path
+    if solution_path:
+        print("Solution found!")
+        for step in solution_path:
+            print(step)
+    else:
+        print("No solution found.")
 
    
\ No newline at end of file